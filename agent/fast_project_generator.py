@@ -7,300 +7,30 @@ from typing import Dict, Any, List
 import os
 import asyncio
 import time
-import json
-import re
 import uuid
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import hashlib
+import functools
+import orjson
+import aiofiles
 from dotenv import load_dotenv
 
 from agent.states import Plan, File, TaskPlan, ImplementationTask, CoderState
-from agent.tools import write_file, read_file
+from agent.tools import write_file, read_file, safe_path_for_project
 from agent.monitoring import workflow_monitor
 
 load_dotenv()
 
-class FastProjectGenerator:
-    """Ultra-fast project generator with parallel processing."""
-    
-    def __init__(self):
-        # Use fastest model for simple tasks
-        self.fast_llm = ChatGoogleGenerativeAI(
-            model="gemini-1.5-flash-8b",
-            api_key=os.getenv("GOOGLE_API_KEY"),
-            temperature=0.1,
-            max_tokens=1000,
-            request_timeout=8
-        )
-        
-        # Standard model for complex tasks
-        self.standard_llm = ChatGoogleGenerativeAI(
-            model="gemini-1.5-flash",
-            api_key=os.getenv("GOOGLE_API_KEY"),
-            temperature=0.3,
-            request_timeout=15
-        )
-        
-        self.executor = ThreadPoolExecutor(max_workers=6)
-        
-        # Pre-compiled templates for common project types
-        self.project_templates = {
-            'todo_app': {
-                'name': 'Modern Todo App',
-                'description': 'A sleek todo application with local storage',
-                'techstack': 'HTML, CSS, JavaScript',
-                'features': ['Add tasks', 'Mark complete', 'Delete tasks', 'Local storage', 'Responsive design'],
-                'files': [
-                    {'path': 'index.html', 'purpose': 'Main HTML structure'},
-                    {'path': 'style.css', 'purpose': 'Styling and layout'},
-                    {'path': 'script.js', 'purpose': 'JavaScript functionality'}
-                ]
-            },
-            'calculator': {
-                'name': 'Modern Calculator',
-                'description': 'A colorful calculator with advanced operations',
-                'techstack': 'HTML, CSS, JavaScript',
-                'features': ['Basic math operations', 'Colorful design', 'Keyboard support', 'History display'],
-                'files': [
-                    {'path': 'index.html', 'purpose': 'Calculator interface'},
-                    {'path': 'style.css', 'purpose': 'Modern styling'},
-                    {'path': 'script.js', 'purpose': 'Calculator logic'}
-                ]
-            },
-            'portfolio': {
-                'name': 'Creative Portfolio',
-                'description': 'A personal portfolio website with modern design',
-                'techstack': 'HTML, CSS, JavaScript',
-                'features': ['Hero section', 'Projects showcase', 'About section', 'Contact form', 'Animations'],
-                'files': [
-                    {'path': 'index.html', 'purpose': 'Main portfolio structure'},
-                    {'path': 'style.css', 'purpose': 'Creative styling and animations'},
-                    {'path': 'script.js', 'purpose': 'Interactive features'}
-                ]
-            }
-        }
-        
-        # Pre-compiled code templates
-        self.code_templates = {
-            'html_base': '''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title}</title>
-    <link rel="stylesheet" href="style.css">
-</head>
-<body>
-    {body_content}
-    <script src="script.js"></script>
-</body>
-</html>''',
-            'css_modern': '''/* Modern CSS Reset and Base Styles */
-* {
-    margin: 0;
-    padding: 0;
-    box-sizing: border-box;
-}
-
-body {
-    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-    line-height: 1.6;
-    color: #333;
-    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-    min-height: 100vh;
-}
-
-.container {
-    max-width: 1000px;
-    margin: 0 auto;
-    padding: 20px;
-}
-
-/* Responsive Design */
-@media (max-width: 768px) {
-    .container {
-        padding: 15px;
-    }
-}'''
-        }
-    
-    def _detect_project_type(self, prompt: str) -> str:
-        """Quickly detect project type from prompt."""
-        prompt_lower = prompt.lower()
-        
-        if any(word in prompt_lower for word in ['todo', 'task', 'list']):
-            return 'todo_app'
-        elif any(word in prompt_lower for word in ['calculator', 'calc', 'math']):
-            return 'calculator'
-        elif any(word in prompt_lower for word in ['portfolio', 'personal', 'showcase']):
-            return 'portfolio'
-        else:
-            return 'custom'
-    
-    async def fast_planner_agent(self, user_prompt: str, session_id: str) -> Plan:
-        """Ultra-fast planner using templates and parallel processing."""
-        start_time = time.time()
-        
-        workflow_monitor.start_session(session_id, user_prompt)
-        workflow_monitor.start_step("Fast Planner", "Analyzing request with templates")
-        
-        try:
-            project_type = self._detect_project_type(user_prompt)
-            
-            if project_type in self.project_templates:
-                # Use pre-compiled template for instant response
-                template = self.project_templates[project_type]
-                
-                files = [File(path=f["path"], purpose=f["purpose"]) for f in template["files"]]
-                plan = Plan(
-                    name=template["name"],
-                    description=template["description"],
-                    techstack=template["techstack"],
-                    features=template["features"],
-                    files=files
-                )
-                
-                elapsed = (time.time() - start_time) * 1000
-                print(f"⚡ Template-based plan in {elapsed:.1f}ms")
-                
-            else:
-                # Use fast LLM for custom projects
-                prompt_text = f"""Create a project plan for: {user_prompt}
-
-Respond with ONLY a JSON object:
-{{
-  "name": "Project Name",
-  "description": "Brief description", 
-  "techstack": "Technologies to use",
-  "features": ["feature1", "feature2", "feature3"],
-  "files": [
-    {{"path": "index.html", "purpose": "Main structure"}},
-    {{"path": "style.css", "purpose": "Styling"}},
-    {{"path": "script.js", "purpose": "Functionality"}}
-  ]
-}}"""
-                
-                response = await asyncio.get_event_loop().run_in_executor(
-                    self.executor,
-                    lambda: self.fast_llm.invoke(prompt_text)
-                )
-                
-                # Quick JSON parsing
-                content = response.content
-                json_match = re.search(r'\{.*\}', content, re.DOTALL)
-                if json_match:
-                    data = json.loads(json_match.group())
-                    files = [File(path=f["path"], purpose=f["purpose"]) for f in data["files"]]
-                    plan = Plan(
-                        name=data["name"],
-                        description=data["description"],
-                        techstack=data["techstack"],
-                        features=data["features"],
-                        files=files
-                    )
-                else:
-                    raise ValueError("Could not parse response")
-                
-                elapsed = (time.time() - start_time) * 1000
-                print(f"🔥 Custom plan in {elapsed:.1f}ms")
-            
-            workflow_monitor.complete_step(plan.model_dump())
-            return plan
-            
-        except Exception as e:
-            workflow_monitor.error_step(str(e))
-            raise e
-    
-    async def fast_architect_agent(self, plan: Plan) -> TaskPlan:
-        """Fast architect with parallel task creation."""
-        start_time = time.time()
-        
-        workflow_monitor.start_step("Fast Architect", "Creating implementation tasks")
-        
-        try:
-            # Create tasks in parallel for each file
-            async def create_task_for_file(file: File) -> ImplementationTask:
-                if file.path.endswith('.html'):
-                    task_desc = f"Create {file.path} with modern HTML structure, semantic elements, and proper meta tags."
-                elif file.path.endswith('.css'):
-                    task_desc = f"Create {file.path} with modern CSS, responsive design, and attractive styling."
-                elif file.path.endswith('.js'):
-                    task_desc = f"Create {file.path} with clean JavaScript, proper event handling, and modern ES6+ features."
-                else:
-                    task_desc = f"Create {file.path} implementing {file.purpose}"
-                
-                return ImplementationTask(filepath=file.path, task_description=task_desc)
-            
-            # Execute in parallel
-            tasks = await asyncio.gather(*[create_task_for_file(file) for file in plan.files])
-            
-            task_plan = TaskPlan(implementation_steps=tasks)
-            task_plan.plan = plan
-            
-            elapsed = (time.time() - start_time) * 1000
-            print(f"⚡ Architecture in {elapsed:.1f}ms")
-            
-            workflow_monitor.complete_step(task_plan.model_dump())
-            return task_plan
-            
-        except Exception as e:
-            workflow_monitor.error_step(str(e))
-            raise e
-    
-    async def fast_coder_agent(self, task_plan: TaskPlan) -> dict:
-        """Ultra-fast coder with parallel file generation."""
-        start_time = time.time()
-        
-        workflow_monitor.start_step("Fast Coder", "Generating files in parallel")
-        
-        try:
-            async def generate_file(task: ImplementationTask) -> tuple:
-                file_start = time.time()
-                
-                try:
-                    # Use templates for common files
-                    if task.filepath == 'index.html':
-                        content = await self._generate_html_fast(task_plan.plan)
-                    elif task.filepath == 'style.css':
-                        content = await self._generate_css_fast(task_plan.plan)
-                    elif task.filepath == 'script.js':
-                        content = await self._generate_js_fast(task_plan.plan)
-                    else:
-                        content = await self._generate_custom_file(task)
-                    
-                    # Write file
-                    write_file.run(task.filepath, content)
-                    
-                    file_elapsed = (time.time() - file_start) * 1000
-                    print(f"✅ Generated {task.filepath} in {file_elapsed:.1f}ms")
-                    
-                    return (task.filepath, "success", content[:100] + "...")
-                    
-                except Exception as e:
-                    file_elapsed = (time.time() - file_start) * 1000
-                    print(f"❌ Failed {task.filepath} in {file_elapsed:.1f}ms: {str(e)}")
-                    return (task.filepath, "error", str(e))
-            
-            # Generate all files in parallel
-            results = await asyncio.gather(*[generate_file(task) for task in task_plan.implementation_steps])
-            
-            elapsed = (time.time() - start_time) * 1000
-            print(f"🚀 All files generated in {elapsed:.1f}ms")
-            
-            workflow_monitor.complete_step({"files_generated": len(results), "results": results})
-            workflow_monitor.complete_session("Project completed successfully")
-            
-            return {"status": "DONE", "results": results, "generation_time": elapsed}
-            
-        except Exception as e:
-            workflow_monitor.error_step(str(e))
-            return {"status": "ERROR", "error": str(e)}
-    
-    async def _generate_html_fast(self, plan: Plan) -> str:
-        """Generate HTML using templates and fast LLM."""
-        project_type = plan.name.lower()
-        
-        if 'todo' in project_type:
-            body_content = '''
+# uvloop's libuv-based event loop is markedly faster than the stdlib
+# selector loop; fall back silently where it is unavailable (e.g. Windows).
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
+# Static bodies for template projects - rendered with zero LLM calls.
+_TEMPLATE_HTML_BODIES = {
+    'todo': '''
     <div class="container">
         <h1>Todo App</h1>
         <div class="input-section">
@@ -308,9 +38,8 @@ Respond with ONLY a JSON object:
             <button id="addBtn">Add Task</button>
         </div>
         <ul id="todoList"></ul>
-    </div>'''
-        elif 'calculator' in project_type:
-            body_content = '''
+    </div>''',
+    'calculator': '''
     <div class="calculator">
         <div class="display">
             <input type="text" id="result" readonly>
@@ -322,30 +51,31 @@ Respond with ONLY a JSON object:
             <button onclick="appendToDisplay('*')">×</button>
             <!-- More calculator buttons -->
         </div>
+    </div>''',
+    'portfolio': '''
+    <div class="container">
+        <section class="hero">
+            <h1>Hi, I'm a Creator</h1>
+            <p>Welcome to my portfolio</p>
+            <a href="#projects" class="btn">View My Work</a>
+        </section>
+        <section id="projects" class="section">
+            <h2>Projects</h2>
+            <div class="projects-grid" id="projectsGrid"></div>
+        </section>
+        <section id="about" class="section">
+            <h2>About Me</h2>
+            <p>I build clean, modern web experiences.</p>
+        </section>
+        <section id="contact" class="section">
+            <h2>Contact</h2>
+            <a href="mailto:hello@example.com" class="btn">Get In Touch</a>
+        </section>
     </div>'''
-        else:
-            # Use fast LLM for custom HTML
-            prompt = f"Generate HTML body content for: {plan.description}. Features: {', '.join(plan.features)}. Keep it clean and semantic."
-            response = await asyncio.get_event_loop().run_in_executor(
-                self.executor,
-                lambda: self.fast_llm.invoke(prompt)
-            )
-            body_content = response.content
-        
-        return self.code_templates['html_base'].format(
-            title=plan.name,
-            body_content=body_content
-        )
-    
-    async def _generate_css_fast(self, plan: Plan) -> str:
-        """Generate CSS using templates and fast styling."""
-        base_css = self.code_templates['css_modern']
-        
-        # Add specific styles based on project type
-        project_type = plan.name.lower()
-        
-        if 'todo' in project_type:
-            specific_css = '''
+}
+
+_TEMPLATE_CSS = {
+    'todo': '''
 
 /* Todo App Styles */
 .input-section {
@@ -385,9 +115,8 @@ Respond with ONLY a JSON object:
     display: flex;
     justify-content: space-between;
     align-items: center;
-}'''
-        elif 'calculator' in project_type:
-            specific_css = '''
+}''',
+    'calculator': '''
 
 /* Calculator Styles */
 .calculator {
@@ -424,9 +153,52 @@ Respond with ONLY a JSON object:
     border-radius: 8px;
     cursor: pointer;
     transition: all 0.2s;
-}'''
-        else:
-            specific_css = '''
+}''',
+    'portfolio': '''
+
+/* Portfolio Styles */
+.hero {
+    text-align: center;
+    padding: 60px 0;
+    background: rgba(255,255,255,0.1);
+    border-radius: 15px;
+    margin: 20px 0;
+}
+
+.hero h1 {
+    font-size: 3rem;
+    margin-bottom: 20px;
+    color: white;
+}
+
+.section {
+    background: white;
+    border-radius: 15px;
+    padding: 30px;
+    margin: 20px 0;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+}
+
+.projects-grid {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
+    gap: 20px;
+}
+
+.btn {
+    display: inline-block;
+    padding: 12px 30px;
+    background: linear-gradient(45deg, #667eea, #764ba2);
+    color: white;
+    text-decoration: none;
+    border-radius: 25px;
+    transition: transform 0.3s;
+}
+
+.btn:hover {
+    transform: translateY(-2px);
+}''',
+    'custom': '''
 
 /* Custom Project Styles */
 .hero {
@@ -456,22 +228,17 @@ Respond with ONLY a JSON object:
 .btn:hover {
     transform: translateY(-2px);
 }'''
-        
-        return base_css + specific_css
-    
-    async def _generate_js_fast(self, plan: Plan) -> str:
-        """Generate JavaScript using templates and patterns."""
-        project_type = plan.name.lower()
-        
-        if 'todo' in project_type:
-            return '''
+}
+
+_TEMPLATE_JS = {
+    'todo': '''
 // Todo App JavaScript
 let todos = JSON.parse(localStorage.getItem('todos')) || [];
 
 function renderTodos() {
     const todoList = document.getElementById('todoList');
     todoList.innerHTML = '';
-    
+
     todos.forEach((todo, index) => {
         const li = document.createElement('li');
         li.className = 'todo-item';
@@ -489,7 +256,7 @@ function renderTodos() {
 function addTodo() {
     const input = document.getElementById('todoInput');
     const text = input.value.trim();
-    
+
     if (text) {
         todos.push({ text, completed: false });
         input.value = '';
@@ -522,9 +289,8 @@ document.getElementById('todoInput').addEventListener('keypress', (e) => {
 
 // Initial render
 renderTodos();
-'''
-        elif 'calculator' in project_type:
-            return '''
+''',
+    'calculator': '''
 // Calculator JavaScript
 let display = document.getElementById('result');
 let currentInput = '0';
@@ -553,7 +319,7 @@ function appendToDisplay(value) {
         currentInput = '0';
         shouldResetDisplay = false;
     }
-    
+
     if (currentInput === '0' && value !== '.') {
         currentInput = value;
     } else {
@@ -593,38 +359,566 @@ document.addEventListener('keydown', (e) => {
 });
 
 updateDisplay();
+''',
+    'portfolio': '''
+// Portfolio JavaScript
+const projects = [
+    { title: 'Project One', description: 'A modern web application' },
+    { title: 'Project Two', description: 'A creative design showcase' },
+    { title: 'Project Three', description: 'An interactive experience' }
+];
+
+function renderProjects() {
+    const grid = document.getElementById('projectsGrid');
+    grid.innerHTML = projects.map(p => `
+        <div class="project-card">
+            <h3>${p.title}</h3>
+            <p>${p.description}</p>
+        </div>
+    `).join('');
+}
+
+// Smooth scrolling for anchor links
+document.querySelectorAll('a[href^="#"]').forEach(anchor => {
+    anchor.addEventListener('click', (e) => {
+        e.preventDefault();
+        document.querySelector(anchor.getAttribute('href')).scrollIntoView({ behavior: 'smooth' });
+    });
+});
+
+renderProjects();
 '''
+}
+
+# project_type -> key into the template body/CSS/JS tables
+_TEMPLATE_KEYS = {'todo_app': 'todo', 'calculator': 'calculator', 'portfolio': 'portfolio'}
+
+# Prompt templates interned once; formatted per call on the fan-out path
+_CUSTOM_PROMPT = "Generate content for {p}: {d}. Provide clean, modern code."
+_HTML_PROMPT = "Generate HTML body content for: {d}. Features: {f}. Keep it clean and semantic."
+_JS_PROMPT = "Generate JavaScript for: {d}. Features: {f}. Use modern ES6+, event listeners, and proper structure."
+
+
+@functools.cache
+def _fast_llm() -> ChatGoogleGenerativeAI:
+    """Fastest model for simple tasks; built once per process."""
+    return ChatGoogleGenerativeAI(
+        model="gemini-1.5-flash-8b",
+        api_key=os.getenv("GOOGLE_API_KEY"),
+        temperature=0.1,
+        max_tokens=1000,
+        request_timeout=8,
+        transport="grpc_asyncio"
+    )
+
+
+@functools.cache
+def _standard_llm() -> ChatGoogleGenerativeAI:
+    """Standard model for complex tasks; built once per process."""
+    return ChatGoogleGenerativeAI(
+        model="gemini-1.5-flash",
+        api_key=os.getenv("GOOGLE_API_KEY"),
+        temperature=0.3,
+        request_timeout=15,
+        transport="grpc_asyncio"
+    )
+
+
+@functools.cache
+def _oneshot_llm() -> ChatGoogleGenerativeAI:
+    """JSON-mode client for fused plan+code generation; built once per process."""
+    return ChatGoogleGenerativeAI(
+        model="gemini-1.5-flash",
+        api_key=os.getenv("GOOGLE_API_KEY"),
+        temperature=0.3,
+        request_timeout=30,
+        response_mime_type="application/json",
+        transport="grpc_asyncio"
+    )
+
+
+@functools.cache
+def _planner_llm() -> ChatGoogleGenerativeAI:
+    """Planner client with JSON mode enabled; built once per process."""
+    return ChatGoogleGenerativeAI(
+        model="gemini-1.5-flash-8b",
+        api_key=os.getenv("GOOGLE_API_KEY"),
+        temperature=0.1,
+        max_tokens=1000,
+        request_timeout=8,
+        response_mime_type="application/json",
+        transport="grpc_asyncio"
+    )
+
+class FastProjectGenerator:
+    """Ultra-fast project generator with parallel processing."""
+    
+    def __init__(self):
+        # Clients are shared at module scope so re-instantiation stays cheap
+        self.fast_llm = _fast_llm()
+        self.standard_llm = _standard_llm()
+        self.planner_llm = _planner_llm()
+
+        # Keep concurrent LLM calls within provider rate limits
+        self._llm_sem = asyncio.Semaphore(4)
+
+        # Memoized fast-model responses keyed by prompt hash; at temperature
+        # 0.1 repeated prompts yield effectively identical outputs
+        self._response_cache: Dict[bytes, str] = {}
+
+        # Monitor events are buffered here and applied by a background task,
+        # keeping subscriber side-effects off the generation hot path
+        self._monitor_q: asyncio.Queue = asyncio.Queue()
+
+        # Pre-compiled templates for common project types
+        self.project_templates = {
+            'todo_app': {
+                'name': 'Modern Todo App',
+                'description': 'A sleek todo application with local storage',
+                'techstack': 'HTML, CSS, JavaScript',
+                'features': ['Add tasks', 'Mark complete', 'Delete tasks', 'Local storage', 'Responsive design'],
+                'files': [
+                    {'path': 'index.html', 'purpose': 'Main HTML structure'},
+                    {'path': 'style.css', 'purpose': 'Styling and layout'},
+                    {'path': 'script.js', 'purpose': 'JavaScript functionality'}
+                ]
+            },
+            'calculator': {
+                'name': 'Modern Calculator',
+                'description': 'A colorful calculator with advanced operations',
+                'techstack': 'HTML, CSS, JavaScript',
+                'features': ['Basic math operations', 'Colorful design', 'Keyboard support', 'History display'],
+                'files': [
+                    {'path': 'index.html', 'purpose': 'Calculator interface'},
+                    {'path': 'style.css', 'purpose': 'Modern styling'},
+                    {'path': 'script.js', 'purpose': 'Calculator logic'}
+                ]
+            },
+            'portfolio': {
+                'name': 'Creative Portfolio',
+                'description': 'A personal portfolio website with modern design',
+                'techstack': 'HTML, CSS, JavaScript',
+                'features': ['Hero section', 'Projects showcase', 'About section', 'Contact form', 'Animations'],
+                'files': [
+                    {'path': 'index.html', 'purpose': 'Main portfolio structure'},
+                    {'path': 'style.css', 'purpose': 'Creative styling and animations'},
+                    {'path': 'script.js', 'purpose': 'Interactive features'}
+                ]
+            }
+        }
+        
+        # Pre-compiled code templates
+        self.code_templates = {
+            'html_base': '''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title}</title>
+    <link rel="stylesheet" href="style.css">
+</head>
+<body>
+    {body_content}
+    <script src="script.js"></script>
+</body>
+</html>''',
+            'css_modern': '''/* Modern CSS Reset and Base Styles */
+* {
+    margin: 0;
+    padding: 0;
+    box-sizing: border-box;
+}
+
+body {
+    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+    line-height: 1.6;
+    color: #333;
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    min-height: 100vh;
+}
+
+.container {
+    max-width: 1000px;
+    margin: 0 auto;
+    padding: 20px;
+}
+
+/* Responsive Design */
+@media (max-width: 768px) {
+    .container {
+        padding: 15px;
+    }
+}'''
+        }
+
+        # Full CSS variants are static - concatenate base + per-type styles once
+        self._css_by_type = {
+            key: self.code_templates['css_modern'] + css
+            for key, css in _TEMPLATE_CSS.items()
+        }
+
+        # Template plans are static - pay the pydantic validation cost once
+        self._prebuilt_plans = {
+            key: Plan(
+                name=tmpl['name'],
+                description=tmpl['description'],
+                techstack=tmpl['techstack'],
+                features=tmpl['features'],
+                files=[File(path=f['path'], purpose=f['purpose']) for f in tmpl['files']]
+            )
+            for key, tmpl in self.project_templates.items()
+        }
+
+    # Keyword sets checked against the tokenized prompt via C-level set intersection
+    _TYPE_KEYWORDS = {
+        'todo_app': frozenset({'todo', 'task', 'list'}),
+        'calculator': frozenset({'calculator', 'calc', 'math'}),
+        'portfolio': frozenset({'portfolio', 'personal', 'showcase'}),
+    }
+
+    def _detect_project_type(self, prompt: str) -> str:
+        """Quickly detect project type from prompt."""
+        words = set(prompt.lower().split())
+        for project_type, keywords in self._TYPE_KEYWORDS.items():
+            if words & keywords:
+                return project_type
+        return 'custom'
+    
+    async def fast_planner_agent(self, user_prompt: str, session_id: str) -> Plan:
+        """Ultra-fast planner using templates and parallel processing."""
+        start_time = time.time()
+        
+        self._emit('start_session', session_id, user_prompt)
+        self._emit('start_step', "Fast Planner", "Analyzing request with templates")
+        
+        try:
+            project_type = self._detect_project_type(user_prompt)
+            
+            if project_type in self._prebuilt_plans:
+                # Use the pre-constructed Plan for instant response
+                plan = self._prebuilt_plans[project_type]
+
+                elapsed = (time.time() - start_time) * 1000
+                print(f"⚡ Template-based plan in {elapsed:.1f}ms")
+                
+            else:
+                # Use fast LLM for custom projects
+                prompt_text = f"""Create a project plan for: {user_prompt}
+
+Respond with ONLY a JSON object:
+{{
+  "name": "Project Name",
+  "description": "Brief description", 
+  "techstack": "Technologies to use",
+  "features": ["feature1", "feature2", "feature3"],
+  "files": [
+    {{"path": "index.html", "purpose": "Main structure"}},
+    {{"path": "style.css", "purpose": "Styling"}},
+    {{"path": "script.js", "purpose": "Functionality"}}
+  ]
+}}"""
+                
+                response = await self.planner_llm.ainvoke(prompt_text)
+
+                # JSON mode guarantees a parseable object - no regex extraction
+                data = orjson.loads(response.content)
+                files = [File(path=f["path"], purpose=f["purpose"]) for f in data["files"]]
+                plan = Plan(
+                    name=data["name"],
+                    description=data["description"],
+                    techstack=data["techstack"],
+                    features=data["features"],
+                    files=files
+                )
+                
+                elapsed = (time.time() - start_time) * 1000
+                print(f"🔥 Custom plan in {elapsed:.1f}ms")
+            
+            self._emit('complete_step_raw', plan.model_dump_json())
+            return plan
+            
+        except Exception as e:
+            self._emit('error_step', str(e))
+            raise e
+    
+    _EXT_TASK_DESCRIPTIONS = {
+        '.html': "Create {path} with modern HTML structure, semantic elements, and proper meta tags.",
+        '.css': "Create {path} with modern CSS, responsive design, and attractive styling.",
+        '.js': "Create {path} with clean JavaScript, proper event handling, and modern ES6+ features.",
+    }
+
+    def _build_tasks(self, plan: Plan) -> TaskPlan:
+        """Build implementation tasks from a plan - pure string work, no I/O."""
+        tasks = []
+        for file in plan.files:
+            ext = os.path.splitext(file.path)[1]
+            template = self._EXT_TASK_DESCRIPTIONS.get(ext)
+            if template:
+                task_desc = template.format(path=file.path)
+            else:
+                task_desc = f"Create {file.path} implementing {file.purpose}"
+            tasks.append(ImplementationTask(filepath=file.path, task_description=task_desc))
+
+        task_plan = TaskPlan(implementation_steps=tasks)
+        task_plan.plan = plan
+        return task_plan
+
+    def fast_architect_agent(self, plan: Plan) -> TaskPlan:
+        """Fast architect - task descriptions are a pure function of the plan."""
+        start_time = time.time()
+
+        self._emit('start_step', "Fast Architect", "Creating implementation tasks")
+
+        try:
+            task_plan = self._build_tasks(plan)
+
+            elapsed = (time.time() - start_time) * 1000
+            print(f"⚡ Architecture in {elapsed:.1f}ms")
+            
+            self._emit('complete_step_raw', task_plan.model_dump_json())
+            return task_plan
+            
+        except Exception as e:
+            self._emit('error_step', str(e))
+            raise e
+    
+    async def fast_coder_agent(self, task_plan: TaskPlan) -> dict:
+        """Ultra-fast coder with parallel file generation."""
+        start_time = time.time()
+        
+        self._emit('start_step', "Fast Coder", "Generating files in parallel")
+        
+        try:
+            async def generate_file(task: ImplementationTask) -> tuple:
+                file_start = time.time()
+                
+                try:
+                    # Use templates for common files
+                    if task.filepath == 'index.html':
+                        content = await self._generate_html_fast(task_plan.plan)
+                    elif task.filepath == 'style.css':
+                        content = self._generate_css_fast(task_plan.plan)
+                    elif task.filepath == 'script.js':
+                        content = await self._generate_js_fast(task_plan.plan)
+                    else:
+                        content = await self._generate_custom_file(task)
+                    
+                    # Write file without blocking the event loop
+                    await self._awrite(task.filepath, content)
+                    
+                    file_elapsed = (time.time() - file_start) * 1000
+                    print(f"✅ Generated {task.filepath} in {file_elapsed:.1f}ms")
+                    
+                    return (task.filepath, "success", content[:100] + "...")
+                    
+                except Exception as e:
+                    file_elapsed = (time.time() - file_start) * 1000
+                    print(f"❌ Failed {task.filepath} in {file_elapsed:.1f}ms: {str(e)}")
+                    return (task.filepath, "error", str(e))
+            
+            # Dispatch each file as soon as its task is known
+            pending = [asyncio.create_task(generate_file(task)) for task in task_plan.implementation_steps]
+            results = await asyncio.gather(*pending)
+            
+            elapsed = (time.time() - start_time) * 1000
+            print(f"🚀 All files generated in {elapsed:.1f}ms")
+            
+            self._emit('complete_step_raw', orjson.dumps({"files_generated": len(results), "results": results}))
+            self._emit('complete_session', "Project completed successfully")
+            
+            return {"status": "DONE", "results": results, "generation_time": elapsed}
+            
+        except Exception as e:
+            self._emit('error_step', str(e))
+            return {"status": "ERROR", "error": str(e)}
+    
+    def _template_key_for_plan(self, plan: Plan) -> str:
+        """Map a plan name onto a static template key, or '' if none matches."""
+        project_type = plan.name.lower()
+        for key in _TEMPLATE_HTML_BODIES:
+            if key in project_type:
+                return key
+        return ''
+
+    def _render_template_project(self, project_type: str, plan: Plan) -> Dict[str, str]:
+        """Render every file of a template project from in-memory strings."""
+        key = _TEMPLATE_KEYS[project_type]
+        return {
+            'index.html': self.code_templates['html_base'].format(
+                title=plan.name, body_content=_TEMPLATE_HTML_BODIES[key]),
+            'style.css': self._css_by_type[key],
+            'script.js': _TEMPLATE_JS[key],
+        }
+
+    async def _generate_html_fast(self, plan: Plan) -> str:
+        """Generate HTML using templates and fast LLM."""
+        key = self._template_key_for_plan(plan)
+
+        if key:
+            body_content = _TEMPLATE_HTML_BODIES[key]
+        else:
+            # Use fast LLM for custom HTML
+            prompt = _HTML_PROMPT.format(d=plan.description, f=', '.join(plan.features))
+            body_content = await self._cached_invoke(prompt)
+        
+        return self.code_templates['html_base'].format(
+            title=plan.name,
+            body_content=body_content
+        )
+    
+    def _generate_css_fast(self, plan: Plan) -> str:
+        """Pick the precomputed CSS variant for the project type."""
+        key = self._template_key_for_plan(plan) or 'custom'
+        return self._css_by_type[key]
+    
+    async def _generate_js_fast(self, plan: Plan) -> str:
+        """Generate JavaScript using templates and patterns."""
+        key = self._template_key_for_plan(plan)
+
+        if key:
+            return _TEMPLATE_JS[key]
         else:
             # Generate custom JavaScript with fast LLM
-            prompt = f"Generate JavaScript for: {plan.description}. Features: {', '.join(plan.features)}. Use modern ES6+, event listeners, and proper structure."
-            response = await asyncio.get_event_loop().run_in_executor(
-                self.executor,
-                lambda: self.fast_llm.invoke(prompt)
-            )
-            return response.content
+            prompt = _JS_PROMPT.format(d=plan.description, f=', '.join(plan.features))
+            return await self._cached_invoke(prompt)
     
     async def _generate_custom_file(self, task: ImplementationTask) -> str:
         """Generate custom file content using fast LLM."""
-        prompt = f"Generate content for {task.filepath}: {task.task_description}. Provide clean, modern code."
-        response = await asyncio.get_event_loop().run_in_executor(
-            self.executor,
-            lambda: self.fast_llm.invoke(prompt)
-        )
-        return response.content
+        prompt = _CUSTOM_PROMPT.format(p=task.filepath, d=task.task_description)
+        return await self._cached_invoke(prompt)
     
+    def _emit(self, method: str, *args) -> None:
+        """Queue a workflow_monitor event instead of running it inline."""
+        self._monitor_q.put_nowait((method, args))
+
+    async def _drain_monitor(self) -> None:
+        """Background task: apply queued monitor events in arrival order."""
+        while True:
+            method, args = await self._monitor_q.get()
+            try:
+                getattr(workflow_monitor, method)(*args)
+            except Exception as e:
+                print(f"Monitor event {method} failed: {e}")
+            finally:
+                self._monitor_q.task_done()
+
+    async def _cached_invoke(self, prompt: str) -> str:
+        """Invoke the fast model, memoizing responses by prompt hash."""
+        key = hashlib.blake2b(prompt.encode(), digest_size=16).digest()
+        cached = self._response_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # Stream tokens as they arrive instead of blocking on the full response
+        chunks = []
+        async with self._llm_sem:
+            async for chunk in self.fast_llm.astream(prompt):
+                chunks.append(chunk.content)
+
+        content = ''.join(chunks)
+        self._response_cache[key] = content
+        return content
+
+    async def _awrite(self, path: str, content: str) -> None:
+        """Write a project file asynchronously, keeping the project-root safety check."""
+        p = safe_path_for_project(path)
+        p.parent.mkdir(parents=True, exist_ok=True)
+        async with aiofiles.open(p, 'w', encoding='utf-8') as f:
+            await f.write(content)
+
+    async def _generate_template_project(self, project_type: str, user_prompt: str,
+                                         session_id: str, start_time: float) -> dict:
+        """Template fast path: render every file in memory, only await file I/O."""
+        self._emit('start_session', session_id, user_prompt)
+        self._emit('start_step', "Template Renderer", f"Rendering {project_type} template")
+
+        plan = self._prebuilt_plans[project_type]
+        contents = self._render_template_project(project_type, plan)
+        await asyncio.gather(*(
+            self._awrite(path, content) for path, content in contents.items()
+        ))
+
+        total_time = (time.time() - start_time) * 1000
+        results = [(path, "success", content[:100] + "...") for path, content in contents.items()]
+
+        self._emit('complete_step_raw', orjson.dumps({"files_generated": len(results), "results": results}))
+        self._emit('complete_session', "Project completed successfully")
+        print(f"⚡ Template project rendered in {total_time:.1f}ms")
+
+        return {
+            "success": True,
+            "session_id": session_id,
+            "generation_time": total_time,
+            "result": {"status": "DONE", "results": results, "generation_time": total_time},
+            "message": f"Project generated in {total_time:.0f}ms!"
+        }
+
+    async def _one_shot_custom(self, user_prompt: str, session_id: str) -> dict:
+        """Fused plan+code generation: one LLM round-trip returns every file."""
+        start_time = time.time()
+
+        self._emit('start_session', session_id, user_prompt)
+        self._emit('start_step', "One-Shot Generator", "Planning and coding in a single call")
+
+        prompt_text = f"""Create a complete web project for: {user_prompt}
+
+Respond with ONLY a JSON object:
+{{
+  "name": "Project Name",
+  "description": "Brief description",
+  "techstack": "Technologies to use",
+  "features": ["feature1", "feature2", "feature3"],
+  "files": [
+    {{"path": "index.html", "content": "<complete file content>"}},
+    {{"path": "style.css", "content": "<complete file content>"}},
+    {{"path": "script.js", "content": "<complete file content>"}}
+  ]
+}}"""
+
+        async with self._llm_sem:
+            response = await _oneshot_llm().ainvoke(prompt_text)
+
+        data = orjson.loads(response.content)
+        await asyncio.gather(*(
+            self._awrite(f["path"], f["content"]) for f in data["files"]
+        ))
+
+        elapsed = (time.time() - start_time) * 1000
+        results = [(f["path"], "success", f["content"][:100] + "...") for f in data["files"]]
+        print(f"🔥 One-shot project '{data.get('name', 'Custom Project')}' in {elapsed:.1f}ms")
+
+        self._emit('complete_step_raw', orjson.dumps({"files_generated": len(results), "results": results}))
+        self._emit('complete_session', "Project completed successfully")
+
+        return {"status": "DONE", "results": results, "generation_time": elapsed}
+
     async def generate_project_fast(self, user_prompt: str) -> dict:
         """Main fast project generation method."""
         session_id = str(uuid.uuid4())
         start_time = time.time()
-        
+
+        # Apply monitor events in the background while generation runs
+        drain_task = asyncio.create_task(self._drain_monitor())
+
         try:
             print(f"🚀 Starting ultra-fast project generation...")
-            
-            # Run all agents in optimized sequence
-            plan = await self.fast_planner_agent(user_prompt, session_id)
-            task_plan = await self.fast_architect_agent(plan)
-            result = await self.fast_coder_agent(task_plan)
-            
+
+            # Zero-LLM fast path for known template projects
+            project_type = self._detect_project_type(user_prompt)
+            if project_type in self.project_templates:
+                return await self._generate_template_project(project_type, user_prompt, session_id, start_time)
+
+            # Custom projects: one fused LLM call replaces the
+            # planner -> architect -> coder round-trips
+            try:
+                result = await self._one_shot_custom(user_prompt, session_id)
+            except Exception as fused_error:
+                # Fall back to the staged pipeline if the fused call fails
+                print(f"⚠️ One-shot generation failed ({fused_error}), falling back to pipeline")
+                plan = await self.fast_planner_agent(user_prompt, session_id)
+                task_plan = self.fast_architect_agent(plan)
+                result = await self.fast_coder_agent(task_plan)
+
             total_time = (time.time() - start_time) * 1000
             print(f"🎉 Project completed in {total_time:.1f}ms")
             
@@ -644,6 +938,10 @@ updateDisplay();
                 "error": str(e),
                 "generation_time": error_time
             }
+        finally:
+            # Flush any buffered monitor events before retiring the drainer
+            await self._monitor_q.join()
+            drain_task.cancel()
 
 # Global fast generator instance
 fast_project_generator = FastProjectGenerator()
\ No newline at end of file
@@ -6,99 +6,236 @@ from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.messages import SystemMessage, HumanMessage
 from typing import Dict, Any, Optional
 import os
+import re
 import asyncio
+import atexit
+import pickle
 import time
 import hashlib
-import pickle
+from collections import OrderedDict
+from functools import cached_property, lru_cache
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor
+import zstandard as zstd
+from diskcache import Cache
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Deletion table for question normalization; one translate() pass beats
+# chained .replace() calls
+_NORM_TABLE = str.maketrans('', '', '?.,')
+
+# Process-global pool for blocking LLM calls, sized via env instead of the
+# old hardcoded 4 workers per agent instance
+_LLM_POOL = ThreadPoolExecutor(max_workers=int(os.getenv('QA_POOL_SIZE', '32')))
+
 class FastCache:
     """In-memory cache with disk persistence for ultra-fast responses."""
     
     def __init__(self, cache_dir: str = "/tmp/coder_buddy_cache"):
-        self.cache_dir = Path(cache_dir)
-        self.cache_dir.mkdir(exist_ok=True)
-        self.memory_cache = {}
+        # Single SQLite-backed store instead of one file (and inode) per
+        # entry; gives atomic writes and built-in LRU eviction for free
+        self._disk = Cache(
+            cache_dir,
+            eviction_policy='least-recently-used',
+            size_limit=2**30
+        )
+        self.memory_cache = OrderedDict()  # protected LRU tier, oldest first
         self.max_memory_size = 1000  # Max items in memory cache
-        
+        # 2Q admission: first-seen entries wait here and are only promoted
+        # to memory_cache when hit again, so one-shot questions can't evict
+        # the hot working set
+        self._probation = OrderedDict()
+        self._max_probation = 2000
+        # Hit/miss counters so the stats endpoint can show whether the
+        # admission scheme is actually holding the hot set
+        self.hits = 0
+        self.misses = 0
+        # LLM answers are highly compressible English; level-1 zstd shrinks
+        # them 3-4x for a few microseconds of CPU per entry
+        self._enc = zstd.ZstdCompressor(level=1)
+        self._dec = zstd.ZstdDecompressor()
+
+        # Warm restarts: reload the protected tier from one big pickle
+        # instead of repopulating it entry by entry from disk
+        self._mem_path = Path(cache_dir) / 'mem.pkl'
+        try:
+            self.memory_cache = pickle.loads(self._mem_path.read_bytes())
+        except (FileNotFoundError, pickle.UnpicklingError, EOFError):
+            pass
+        atexit.register(self._flush)
+
+    def _flush(self) -> None:
+        """Persist the protected memory tier for the next process start."""
+        try:
+            self._mem_path.write_bytes(
+                pickle.dumps(self.memory_cache, protocol=pickle.HIGHEST_PROTOCOL)
+            )
+        except OSError:
+            pass
+
     def _get_key_hash(self, key: str) -> str:
         """Generate a hash for the cache key."""
-        return hashlib.md5(key.encode()).hexdigest()
+        # BLAKE2b is ~3x faster than MD5 on short inputs, and 8 bytes is
+        # plenty of collision space for this workload
+        return hashlib.blake2b(key.encode('utf-8'), digest_size=8).hexdigest()
     
+    def resolve(self, key: str) -> str:
+        """Hash the key once for reuse across get/set."""
+        return self._get_key_hash(key)
+
+    def resolve_pair(self, question: str, context: str) -> str:
+        """Hash a question/context pair without concatenating them first.
+
+        Feeding both parts to the hasher incrementally skips building the
+        throwaway f"{question}|{context}" string; the digest is identical
+        to resolve() on the concatenation, so existing entries still hit.
+        """
+        h = hashlib.blake2b(digest_size=8)
+        h.update(question.encode('utf-8'))
+        h.update(b'|')
+        h.update(context.encode('utf-8'))
+        return h.hexdigest()
+
     def get(self, key: str) -> Optional[str]:
         """Get cached response."""
-        key_hash = self._get_key_hash(key)
-        
-        # Check memory cache first
-        if key_hash in self.memory_cache:
-            return self.memory_cache[key_hash]
-        
-        # Check disk cache
-        cache_file = self.cache_dir / f"{key_hash}.pkl"
-        if cache_file.exists():
+        return self.get_resolved(self.resolve(key))
+
+    def get_resolved(self, key_hash: str) -> Optional[str]:
+        """Get cached response using a pre-resolved key hash."""
+        value = self._memory_get(key_hash)
+        if value is None:
+            value = self._disk_get(key_hash)
+        if value is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return value
+
+    async def aget(self, key: str) -> Optional[str]:
+        """Async get: sync memory probe, disk read off the event loop."""
+        return await self.aget_resolved(self.resolve(key))
+
+    async def aget_resolved(self, key_hash: str) -> Optional[str]:
+        """Async variant of get_resolved.
+
+        The memory tiers are probed synchronously (sub-microsecond, not worth
+        a thread dispatch); only the disk read is pushed off the event loop.
+        """
+        value = self._memory_get(key_hash)
+        if value is None:
+            value = await asyncio.to_thread(self._disk_get, key_hash)
+        if value is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return value
+
+    def _memory_get(self, key_hash: str) -> Optional[str]:
+        """Probe the in-memory tiers only; never touches the filesystem."""
+        # Check the protected memory tier first
+        value = self.memory_cache.get(key_hash)
+        if value is not None:
+            self.memory_cache.move_to_end(key_hash)
+            return value
+
+        # Second touch of a probationary entry earns promotion
+        value = self._probation.pop(key_hash, None)
+        if value is not None:
+            self._remember(key_hash, value)
+            return value
+
+        return None
+
+    def _disk_get(self, key_hash: str) -> Optional[str]:
+        """Read a value from the disk tier and admit it to probation."""
+        blob = self._disk.get(key_hash)
+        if blob is not None:
             try:
-                with open(cache_file, 'rb') as f:
-                    data = pickle.load(f)
-                    # Add to memory cache
-                    if len(self.memory_cache) < self.max_memory_size:
-                        self.memory_cache[key_hash] = data
-                    return data
-            except:
-                pass
-        
+                data = self._dec.decompress(blob).decode('utf-8')
+            except (OSError, zstd.ZstdError, UnicodeDecodeError):
+                # Corrupt entry; treat as a miss rather than masking
+                # KeyboardInterrupt and friends with a bare except
+                return None
+            self._probate(key_hash, data)
+            return data
         return None
-    
+
+    def _probate(self, key_hash: str, value: str) -> None:
+        """Admit a first-seen entry to the probationary queue (FIFO eviction)."""
+        self._probation[key_hash] = value
+        self._probation.move_to_end(key_hash)
+        while len(self._probation) > self._max_probation:
+            self._probation.popitem(last=False)
+
+    def _remember(self, key_hash: str, value: str) -> None:
+        """Insert into the memory tier as most-recent, evicting the LRU entry."""
+        self.memory_cache[key_hash] = value
+        self.memory_cache.move_to_end(key_hash)
+        while len(self.memory_cache) > self.max_memory_size:
+            self.memory_cache.popitem(last=False)
+
     def set(self, key: str, value: str):
         """Set cached response."""
-        key_hash = self._get_key_hash(key)
-        
-        # Save to memory cache
-        if len(self.memory_cache) < self.max_memory_size:
-            self.memory_cache[key_hash] = value
-        
-        # Save to disk cache
-        cache_file = self.cache_dir / f"{key_hash}.pkl"
+        self.set_resolved(self.resolve(key), value)
+
+    def set_resolved(self, key_hash: str, value: str):
+        """Set cached response using a pre-resolved key hash."""
+        # First write lands in the probationary tier
+        self._probate(key_hash, value)
+        self._disk_set(key_hash, value)
+
+    async def aset(self, key: str, value: str):
+        """Async set: memory tiers updated inline, disk write off the loop."""
+        await self.aset_resolved(self.resolve(key), value)
+
+    async def aset_resolved(self, key_hash: str, value: str):
+        """Async variant of set_resolved."""
+        self._probate(key_hash, value)
+        await asyncio.to_thread(self._disk_set, key_hash, value)
+
+    def _disk_set(self, key_hash: str, value: str):
+        """Persist a value to the disk tier."""
         try:
-            with open(cache_file, 'wb') as f:
-                pickle.dump(value, f)
-        except:
+            self._disk.set(key_hash, self._enc.compress(value.encode('utf-8')))
+        except OSError:
+            # A full or read-only disk shouldn't fail the answer
+            pass
+
+    def clear(self) -> None:
+        """Drop every tier: memory, probation, disk, and the warm-start pickle."""
+        self.memory_cache.clear()
+        self._probation.clear()
+        try:
+            self._disk.clear()
+            self._mem_path.unlink(missing_ok=True)
+        except OSError:
             pass
 
 class UltraFastQAAgent:
     """Ultra-fast Q&A agent with multiple optimizations."""
     
     def __init__(self):
-        # Use the fastest Gemini model
-        self.fast_llm = ChatGoogleGenerativeAI(
-            model="gemini-1.5-flash-8b",  # Fastest model
-            api_key=os.getenv("GOOGLE_API_KEY"),
-            temperature=0.1,  # Lower temperature for faster responses
-            max_tokens=500,   # Limit tokens for faster responses
-            request_timeout=5  # 5 second timeout
-        )
-        
-        # Fallback to standard model for complex queries
-        self.standard_llm = ChatGoogleGenerativeAI(
-            model="gemini-1.5-flash",
-            api_key=os.getenv("GOOGLE_API_KEY"),
-            temperature=0.3,
-            request_timeout=10
-        )
-        
         self.cache = FastCache()
-        self.executor = ThreadPoolExecutor(max_workers=4)
-        
+
+        # Singleflight map: cache_key -> Future for the in-flight LLM call,
+        # so concurrent duplicates await one network round-trip
+        self._in_flight: Dict[str, asyncio.Future] = {}
+
         # Pre-compiled system prompts for speed
         self.system_prompts = {
             'technical': """You are a fast technical assistant. Provide concise, accurate code examples and explanations. Keep responses under 400 words unless specifically asked for more detail.""",
             'general': """You are a helpful assistant. Provide clear, concise answers. Keep responses under 300 words unless specifically asked for more detail.""",
             'quick': """Provide a brief, direct answer in 1-2 sentences."""
         }
-        
+
+        # System prompts never change, so validate the message objects once
+        # and reuse them by reference
+        self._sys_msgs = {
+            k: SystemMessage(content=v) for k, v in self.system_prompts.items()
+        }
+
         # Common question patterns for ultra-fast responses
         self.quick_responses = {
             'what is python': "Python is a high-level, interpreted programming language known for its simplicity and readability. It's widely used for web development, data science, AI, and automation.",
@@ -108,93 +245,134 @@ class UltraFastQAAgent:
             'what is html': "HTML (HyperText Markup Language) is the standard markup language for creating web pages. It uses tags to structure content like headings, paragraphs, and links.",
             'what is css': "CSS (Cascading Style Sheets) is a language used to style and layout web pages created with HTML. It controls colors, fonts, spacing, and responsive design."
         }
-    
+
+        # Normalized lookup table and compiled keyword scanners, built once
+        self._normalized_quick = {
+            self._normalize_question(k): v for k, v in self.quick_responses.items()
+        }
+        self._tech_re = re.compile(
+            r'\b(?:code|programming|python|javascript|react|api|database|sql|html|css|'
+            r'debug|error|function|algorithm|framework|library)\b',
+            re.IGNORECASE
+        )
+        self._quick_re = re.compile(
+            r'\b(?:what is|define|meaning of|difference between)\b',
+            re.IGNORECASE
+        )
+
+        # Message bodies, with and without context, formatted in one step
+        self._tmpl_ctx = "Question: {q}\nContext: {c}\n\nProvide a helpful, concise answer."
+        self._tmpl_noctx = "Question: {q}\n\nProvide a helpful, concise answer."
+
+    @cached_property
+    def fast_llm(self) -> ChatGoogleGenerativeAI:
+        """Fastest Gemini model, built on first use to keep import cheap."""
+        return ChatGoogleGenerativeAI(
+            model="gemini-1.5-flash-8b",  # Fastest model
+            api_key=os.getenv("GOOGLE_API_KEY"),
+            temperature=0.1,  # Lower temperature for faster responses
+            max_tokens=500,   # Limit tokens for faster responses
+            request_timeout=5  # 5 second timeout
+        )
+
+    @cached_property
+    def standard_llm(self) -> ChatGoogleGenerativeAI:
+        """Fallback model for complex queries, also built lazily."""
+        return ChatGoogleGenerativeAI(
+            model="gemini-1.5-flash",
+            api_key=os.getenv("GOOGLE_API_KEY"),
+            temperature=0.3,
+            request_timeout=10
+        )
+
+    @lru_cache(maxsize=1024)
     def _normalize_question(self, question: str) -> str:
-        """Normalize question for cache lookup."""
-        return question.lower().strip().replace('?', '').replace('.', '').replace(',', '')
+        """Normalize question for cache lookup.
+
+        Memoized: chat traffic is heavily skewed toward a few popular
+        questions, so repeats become a dict hit instead of string work.
+        """
+        return question.lower().translate(_NORM_TABLE).strip()
     
     def _get_prompt_type(self, question: str) -> str:
         """Determine the best prompt type for the question."""
-        question_lower = question.lower()
-        
-        # Technical keywords
-        technical_keywords = [
-            'code', 'programming', 'python', 'javascript', 'react', 'api',
-            'database', 'sql', 'html', 'css', 'debug', 'error', 'function',
-            'algorithm', 'framework', 'library'
-        ]
-        
-        # Quick answer keywords
-        quick_keywords = ['what is', 'define', 'meaning of', 'difference between']
-        
-        if any(keyword in question_lower for keyword in quick_keywords):
+        if self._quick_re.search(question):
             return 'quick'
-        elif any(keyword in question_lower for keyword in technical_keywords):
+        elif self._tech_re.search(question):
             return 'technical'
         else:
             return 'general'
-    
+
     def _is_simple_question(self, question: str) -> bool:
         """Check if question can be answered with predefined responses."""
-        normalized = self._normalize_question(question)
-        return normalized in self.quick_responses
+        return self._normalize_question(question) in self._normalized_quick
     
     async def answer_question_async(self, question: str, context: str = "") -> str:
         """Async version for even faster responses."""
         start_time = time.time()
         
-        # Check for ultra-fast predefined responses
-        normalized_question = self._normalize_question(question)
-        if normalized_question in self.quick_responses:
-            response = self.quick_responses[normalized_question]
+        # Check for ultra-fast predefined responses - one hash via .get
+        response = self._normalized_quick.get(self._normalize_question(question))
+        if response is not None:
             print(f"⚡ Ultra-fast response in {(time.time() - start_time)*1000:.1f}ms")
             return response
-        
-        # Check cache
-        cache_key = f"{question}|{context}"
-        cached_response = self.cache.get(cache_key)
+
+        # Check cache - the digest doubles as the singleflight key, so no
+        # question+context concatenation is ever built
+        cache_entry = self.cache.resolve_pair(question, context)
+        cached_response = await self.cache.aget_resolved(cache_entry)
         if cached_response:
             print(f"🚀 Cached response in {(time.time() - start_time)*1000:.1f}ms")
             return cached_response
-        
+
+        # Coalesce concurrent duplicates: if the same question is already
+        # being answered, await that call instead of paying for another
+        in_flight = self._in_flight.get(cache_entry)
+        if in_flight is not None:
+            return await in_flight
+
+        loop = asyncio.get_running_loop()
+        fut = loop.create_future()
+        self._in_flight[cache_entry] = fut
+
         # Determine optimal prompt and model
         prompt_type = self._get_prompt_type(question)
-        
+
         # Use fast model for simple questions
         llm = self.fast_llm if prompt_type in ['quick', 'general'] else self.standard_llm
-        system_prompt = self.system_prompts[prompt_type]
         
-        messages = [
-            SystemMessage(content=system_prompt),
-            HumanMessage(content=f"""
-Question: {question}
-{f"Context: {context}" if context else ""}
-
-Provide a helpful, concise answer.
-""")
-        ]
+        body = (self._tmpl_ctx if context else self._tmpl_noctx).format(q=question, c=context)
+        messages = [self._sys_msgs[prompt_type], HumanMessage(content=body)]
         
+        answer = None
         try:
-            # Run in executor for true async
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                self.executor, 
-                lambda: llm.invoke(messages)
-            )
-            
+            # Run in the shared pool for true async; passing the callable and
+            # args directly avoids a lambda/closure per question
+            response = await loop.run_in_executor(_LLM_POOL, llm.invoke, messages)
+
             answer = response.content
-            
+
             # Cache the response
-            self.cache.set(cache_key, answer)
-            
+            await self.cache.aset_resolved(cache_entry, answer)
+
             elapsed = (time.time() - start_time) * 1000
             print(f"🔥 Generated response in {elapsed:.1f}ms")
-            return answer
-            
+
         except Exception as e:
             elapsed = (time.time() - start_time) * 1000
             print(f"❌ Error after {elapsed:.1f}ms: {str(e)}")
-            return f"Sorry, I encountered an error: {str(e)}"
+            answer = f"Sorry, I encountered an error: {str(e)}"
+        finally:
+            # Resolve the future here so coalesced waiters never hang: if
+            # the leader was cancelled (CancelledError skips the except
+            # clause above), propagate the cancellation to them
+            del self._in_flight[cache_entry]
+            if answer is not None:
+                fut.set_result(answer)
+            else:
+                fut.cancel()
+
+        return answer
     
     def answer_question(self, question: str, context: str = "") -> str:
         """Synchronous wrapper for compatibility."""
@@ -210,16 +388,15 @@ Provide a helpful, concise answer.
         """Optimized synchronous version."""
         start_time = time.time()
         
-        # Check for ultra-fast predefined responses
-        normalized_question = self._normalize_question(question)
-        if normalized_question in self.quick_responses:
-            response = self.quick_responses[normalized_question]
+        # Check for ultra-fast predefined responses - one hash via .get
+        response = self._normalized_quick.get(self._normalize_question(question))
+        if response is not None:
             print(f"⚡ Ultra-fast response in {(time.time() - start_time)*1000:.1f}ms")
             return response
-        
+
         # Check cache
-        cache_key = f"{question}|{context}"
-        cached_response = self.cache.get(cache_key)
+        cache_entry = self.cache.resolve_pair(question, context)
+        cached_response = self.cache.get_resolved(cache_entry)
         if cached_response:
             print(f"🚀 Cached response in {(time.time() - start_time)*1000:.1f}ms")
             return cached_response
@@ -227,24 +404,16 @@ Provide a helpful, concise answer.
         # Determine optimal prompt and model
         prompt_type = self._get_prompt_type(question)
         llm = self.fast_llm if prompt_type in ['quick', 'general'] else self.standard_llm
-        system_prompt = self.system_prompts[prompt_type]
         
-        messages = [
-            SystemMessage(content=system_prompt),
-            HumanMessage(content=f"""
-Question: {question}
-{f"Context: {context}" if context else ""}
-
-Provide a helpful, concise answer.
-""")
-        ]
+        body = (self._tmpl_ctx if context else self._tmpl_noctx).format(q=question, c=context)
+        messages = [self._sys_msgs[prompt_type], HumanMessage(content=body)]
         
         try:
             response = llm.invoke(messages)
             answer = response.content
             
             # Cache the response
-            self.cache.set(cache_key, answer)
+            self.cache.set_resolved(cache_entry, answer)
             
             elapsed = (time.time() - start_time) * 1000
             print(f"🔥 Generated response in {elapsed:.1f}ms")
@@ -255,15 +424,23 @@ Provide a helpful, concise answer.
             print(f"❌ Error after {elapsed:.1f}ms: {str(e)}")            
             return f"Sorry, I encountered an error: {str(e)}"
     
+    @lru_cache(maxsize=1024)
     def is_technical_question(self, question: str) -> bool:
-        """Fast technical question detection."""
-        return self._get_prompt_type(question) == 'technical'
+        """Fast technical question detection, memoized per question."""
+        return bool(self._tech_re.search(question))
     
+    async def _warm(self, questions):
+        """Answer the warm-up questions concurrently."""
+        await asyncio.gather(
+            *(self.answer_question_async(q) for q in questions),
+            return_exceptions=True
+        )
+
     def warm_up_cache(self):
         """Pre-populate cache with common responses."""
         common_questions = [
             "What is Python?",
-            "What is JavaScript?", 
+            "What is JavaScript?",
             "What is React?",
             "What is HTML?",
             "What is CSS?",
@@ -273,13 +450,11 @@ Provide a helpful, concise answer.
             "What is a database?",
             "What is Git?"
         ]
-        
+
         print("🔥 Warming up cache with common questions...")
-        for question in common_questions:
-            try:
-                self.answer_question(question)
-            except:
-                pass
+        # Fan the questions out in parallel: wall time drops from N round
+        # trips to roughly one, quota usage unchanged
+        asyncio.run(self._warm(common_questions))
         print("✅ Cache warmed up!")
 
 # Create global ultra-fast instance
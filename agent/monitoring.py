@@ -4,14 +4,14 @@ Monitoring utilities for tracking agent workflows and providing real-time update
 
 import json
 import time
+from collections import OrderedDict
+from itertools import islice
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, asdict
 from pathlib import Path
-import threading
-import queue
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowStep:
     agent_name: str
     step_name: str
@@ -21,7 +21,7 @@ class WorkflowStep:
     result: Optional[Any] = None
     error: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowSession:
     session_id: str
     user_prompt: str
@@ -30,18 +30,24 @@ class WorkflowSession:
     status: str = 'running'  # 'running', 'completed', 'error'
     steps: List[WorkflowStep] = None
     final_result: Optional[Any] = None
-    
+    _cached_dict: Optional[Dict] = None
+    start_time_iso: Optional[str] = None
+
     def __post_init__(self):
         if self.steps is None:
             self.steps = []
+        # start_time never changes, so format it once up front
+        self.start_time_iso = self.start_time.isoformat() if self.start_time else None
 
 class WorkflowMonitor:
+    # Oldest sessions are evicted past this bound
+    MAX_SESSIONS = 256
+
     def __init__(self):
-        self.sessions: Dict[str, WorkflowSession] = {}
+        self.sessions: OrderedDict[str, WorkflowSession] = OrderedDict()
         self.active_session_id: Optional[str] = None
         self.subscribers = []
-        self.update_queue = queue.Queue()
-        
+
     def start_session(self, session_id: str, user_prompt: str) -> WorkflowSession:
         """Start a new workflow session."""
         session = WorkflowSession(
@@ -50,6 +56,9 @@ class WorkflowMonitor:
             start_time=datetime.now()
         )
         self.sessions[session_id] = session
+        self.sessions.move_to_end(session_id)
+        while len(self.sessions) > self.MAX_SESSIONS:
+            self.sessions.popitem(last=False)
         self.active_session_id = session_id
         self._notify_subscribers('session_started', session)
         return session
@@ -67,6 +76,7 @@ class WorkflowMonitor:
             start_time=datetime.now()
         )
         session.steps.append(step)
+        session._cached_dict = None
         self._notify_subscribers('step_started', {'session_id': self.active_session_id, 'step': step})
     
     def complete_step(self, result: Any = None) -> None:
@@ -80,8 +90,19 @@ class WorkflowMonitor:
             current_step.status = 'completed'
             current_step.end_time = datetime.now()
             current_step.result = result
+            session._cached_dict = None
             self._notify_subscribers('step_completed', {'session_id': self.active_session_id, 'step': current_step})
     
+    def complete_step_raw(self, result_json) -> None:
+        """Complete the current step with a pre-serialized JSON result.
+
+        Callers pass `model_dump_json()` / `orjson.dumps()` output directly,
+        skipping the intermediate dict walk of `complete_step`.
+        """
+        if isinstance(result_json, bytes):
+            result_json = result_json.decode()
+        self.complete_step(result_json)
+
     def error_step(self, error: str) -> None:
         """Mark the current step as error."""
         if not self.active_session_id:
@@ -93,6 +114,7 @@ class WorkflowMonitor:
             current_step.status = 'error'
             current_step.end_time = datetime.now()
             current_step.error = error
+            session._cached_dict = None
             self._notify_subscribers('step_error', {'session_id': self.active_session_id, 'step': current_step})
     
     def complete_session(self, final_result: Any = None) -> None:
@@ -104,6 +126,7 @@ class WorkflowMonitor:
         session.status = 'completed'
         session.end_time = datetime.now()
         session.final_result = final_result
+        session._cached_dict = None
         self._notify_subscribers('session_completed', session)
         self.active_session_id = None
     
@@ -115,6 +138,7 @@ class WorkflowMonitor:
         session = self.sessions[self.active_session_id]
         session.status = 'error'
         session.end_time = datetime.now()
+        session._cached_dict = None
         self._notify_subscribers('session_error', {'session': session, 'error': error})
         self.active_session_id = None
     
@@ -123,10 +147,12 @@ class WorkflowMonitor:
         return self.sessions.get(session_id)
     
     def get_recent_sessions(self, limit: int = 10) -> List[WorkflowSession]:
-        """Get recent sessions."""
-        sessions = list(self.sessions.values())
-        sessions.sort(key=lambda x: x.start_time, reverse=True)
-        return sessions[:limit]
+        """Get recent sessions, newest first.
+
+        Sessions are inserted in start order, so reversing the OrderedDict
+        yields newest-first without sorting.
+        """
+        return list(islice(reversed(self.sessions.values()), limit))
     
     def subscribe(self, callback):
         """Subscribe to workflow updates."""
@@ -155,16 +181,25 @@ class WorkflowMonitor:
         }
     
     def _session_to_dict(self, session: WorkflowSession) -> Dict:
-        """Convert a session to dictionary."""
-        return {
+        """Convert a session to dictionary.
+
+        Finished sessions are immutable, so their dict is computed once and
+        reused; mutating calls reset `_cached_dict` to invalidate it.
+        """
+        if session._cached_dict is not None and session.status != 'running':
+            return session._cached_dict
+        result = {
             'session_id': session.session_id,
             'user_prompt': session.user_prompt,
-            'start_time': session.start_time.isoformat() if session.start_time else None,
+            'start_time': session.start_time_iso,
             'end_time': session.end_time.isoformat() if session.end_time else None,
             'status': session.status,
             'steps': [self._step_to_dict(step) for step in session.steps],
             'final_result': str(session.final_result) if session.final_result else None
         }
+        if session.status != 'running':
+            session._cached_dict = result
+        return result
     
     def _step_to_dict(self, step: WorkflowStep) -> Dict:
         """Convert a step to dictionary."""
@@ -6,20 +6,12 @@ from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.messages import SystemMessage, HumanMessage
 from typing import Dict, Any
 import os
+import re
 from dotenv import load_dotenv
 
 load_dotenv()
 
-class GeneralQAAgent:
-    def __init__(self):
-        self.llm = ChatGoogleGenerativeAI(
-            model="gemini-1.5-flash",
-            api_key=os.getenv("GOOGLE_API_KEY"),
-            temperature=0.3
-        )
-        
-    def get_system_prompt(self) -> str:
-        return """You are a comprehensive AI assistant capable of helping with both technical programming questions and general knowledge inquiries.
+_SYSTEM_PROMPT = """You are a comprehensive AI assistant capable of helping with both technical programming questions and general knowledge inquiries.
 
 For TECHNICAL questions:
 - Provide detailed code examples and explanations
@@ -40,6 +32,33 @@ Always:
 - Offer practical, actionable advice
 """
 
+class GeneralQAAgent:
+    def __init__(self):
+        self.llm = ChatGoogleGenerativeAI(
+            model="gemini-1.5-flash",
+            api_key=os.getenv("GOOGLE_API_KEY"),
+            temperature=0.3
+        )
+
+        # Compiled once: one C-level scan per question instead of ~20
+        # Python substring probes
+        technical_keywords = [
+            'code', 'programming', 'python', 'javascript', 'react', 'api',
+            'database', 'sql', 'html', 'css', 'debug', 'error', 'function',
+            'variable', 'algorithm', 'data structure', 'framework', 'library',
+            'git', 'github', 'deployment', 'server', 'backend', 'frontend'
+        ]
+        self._tech_re = re.compile(
+            r'\b(?:' + '|'.join(map(re.escape, technical_keywords)) + r')\b',
+            re.IGNORECASE
+        )
+
+        # The system message never changes; build it once instead of per call
+        self._system_msg = SystemMessage(content=_SYSTEM_PROMPT)
+
+    def get_system_prompt(self) -> str:
+        return _SYSTEM_PROMPT
+
     def answer_question(self, question: str, context: str = "") -> str:
         """
         Answer a general or technical question.
@@ -52,7 +71,7 @@ Always:
             The AI's response
         """
         messages = [
-            SystemMessage(content=self.get_system_prompt()),
+            self._system_msg,
             HumanMessage(content=f"""
 Question: {question}
 
@@ -72,15 +91,7 @@ Please provide a helpful, comprehensive answer.
         """
         Determine if a question is technical/programming related.
         """
-        technical_keywords = [
-            'code', 'programming', 'python', 'javascript', 'react', 'api',
-            'database', 'sql', 'html', 'css', 'debug', 'error', 'function',
-            'variable', 'algorithm', 'data structure', 'framework', 'library',
-            'git', 'github', 'deployment', 'server', 'backend', 'frontend'
-        ]
-        
-        question_lower = question.lower()
-        return any(keyword in question_lower for keyword in technical_keywords)
+        return self._tech_re.search(question) is not None
 
 # Global instance for easy access
 qa_agent = GeneralQAAgent()
\ No newline at end of file
@@ -0,0 +1 @@
+// Color picker JS
\ No newline at end of file
@@ -0,0 +1 @@
+// Contact form JS
\ No newline at end of file
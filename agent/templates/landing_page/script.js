@@ -0,0 +1,15 @@
+// Landing page interactions
+document.querySelector('.cta-button').addEventListener('click', function() {
+    alert('Welcome! This is a demo landing page.');
+});
+
+// Smooth scrolling for navigation
+document.querySelectorAll('nav a').forEach(link => {
+    link.addEventListener('click', function(e) {
+        e.preventDefault();
+        const target = document.querySelector(this.getAttribute('href'));
+        if (target) {
+            target.scrollIntoView({ behavior: 'smooth' });
+        }
+    });
+});
\ No newline at end of file
@@ -0,0 +1 @@
+// Memory game JS
\ No newline at end of file
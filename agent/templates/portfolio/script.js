@@ -0,0 +1,238 @@
+// Portfolio Interactive Features
+class Portfolio {
+    constructor() {
+        this.init();
+    }
+
+    init() {
+        this.setupSmoothScrolling();
+        this.setupSkillBars();
+        this.setupNavbarScroll();
+        this.setupContactForm();
+        this.setupIntersectionObserver();
+    }
+
+    setupSmoothScrolling() {
+        document.querySelectorAll('a[href^="#"]').forEach(anchor => {
+            anchor.addEventListener('click', (e) => {
+                e.preventDefault();
+                const target = document.querySelector(anchor.getAttribute('href'));
+                if (target) {
+                    target.scrollIntoView({
+                        behavior: 'smooth',
+                        block: 'start'
+                    });
+                }
+            });
+        });
+    }
+
+    setupSkillBars() {
+        const animateSkills = () => {
+            const skillBars = document.querySelectorAll('.skill-progress');
+            skillBars.forEach(bar => {
+                const width = bar.getAttribute('data-width');
+                bar.style.width = width;
+            });
+        };
+
+        // Animate skills when about section is visible
+        const aboutSection = document.querySelector('#about');
+        const observer = new IntersectionObserver((entries) => {
+            entries.forEach(entry => {
+                if (entry.isIntersecting) {
+                    setTimeout(animateSkills, 500);
+                    observer.unobserve(entry.target);
+                }
+            });
+        }, { threshold: 0.5 });
+
+        observer.observe(aboutSection);
+    }
+
+    setupNavbarScroll() {
+        const navbar = document.querySelector('.navbar');
+        let scrolled = false;
+        let ticking = false;
+
+        // rAF-throttled: one style write per frame, and only when the
+        // scrolled state actually flips
+        window.addEventListener('scroll', () => {
+            if (ticking) return;
+            ticking = true;
+            requestAnimationFrame(() => {
+                ticking = false;
+                const nowScrolled = window.scrollY > 100;
+                if (nowScrolled === scrolled) return;
+                scrolled = nowScrolled;
+                if (scrolled) {
+                    navbar.style.background = 'rgba(255, 255, 255, 0.98)';
+                    navbar.style.boxShadow = '0 2px 20px rgba(0, 0, 0, 0.1)';
+                } else {
+                    navbar.style.background = 'rgba(255, 255, 255, 0.95)';
+                    navbar.style.boxShadow = 'none';
+                }
+            });
+        });
+    }
+
+    setupContactForm() {
+        const form = document.querySelector('.contact-form');
+        // Cache field references once so submits never re-traverse the DOM
+        const nameField = form.querySelector('input[type="text"]');
+        const emailField = form.querySelector('input[type="email"]');
+        const messageField = form.querySelector('textarea');
+
+        form.addEventListener('submit', (e) => {
+            e.preventDefault();
+
+            // Get form data
+            const name = nameField.value;
+            const email = emailField.value;
+            const message = messageField.value;
+
+            // Simulate sending message
+            this.showFormMessage('Thank you for your message! I will get back to you soon.', 'success');
+
+            // Reset form
+            form.reset();
+        });
+    }
+
+    showFormMessage(message, type) {
+        const messageEl = document.createElement('div');
+        messageEl.className = `form-message ${type}`;
+        messageEl.textContent = message;
+        messageEl.style.cssText = `
+            position: fixed;
+            top: 20px;
+            right: 20px;
+            padding: 15px 25px;
+            background: ${type === 'success' ? '#4caf50' : '#f44336'};
+            color: white;
+            border-radius: 10px;
+            z-index: 10000;
+            animation: slideIn 0.3s ease;
+        `;
+        
+        document.body.appendChild(messageEl);
+        
+        setTimeout(() => {
+            messageEl.style.animation = 'slideOut 0.3s ease forwards';
+            setTimeout(() => {
+                document.body.removeChild(messageEl);
+            }, 300);
+        }, 3000);
+    }
+
+    setupIntersectionObserver() {
+        const observerOptions = {
+            threshold: 0.1,
+            rootMargin: '0px 0px -50px 0px'
+        };
+
+        // Batch all newly visible cards into one rAF class flip, so a
+        // scroll that reveals several cards costs one style recalc
+        const pending = [];
+        const observer = new IntersectionObserver((entries) => {
+            let scheduled = pending.length > 0;
+            entries.forEach(entry => {
+                if (entry.isIntersecting) {
+                    pending.push(entry.target);
+                    observer.unobserve(entry.target);
+                }
+            });
+            if (!scheduled && pending.length > 0) {
+                requestAnimationFrame(() => {
+                    pending.splice(0).forEach(el => el.classList.add('animate-in'));
+                });
+            }
+        }, observerOptions);
+
+        // Observe project cards
+        document.querySelectorAll('.project-card').forEach(card => {
+            observer.observe(card);
+        });
+    }
+}
+
+// Initialize portfolio when DOM is loaded
+document.addEventListener('DOMContentLoaded', () => {
+    new Portfolio();
+});
+
+// Add some interactive particles for extra visual appeal
+class ParticleSystem {
+    constructor() {
+        this.canvas = document.createElement('canvas');
+        this.ctx = this.canvas.getContext('2d');
+        this.particles = [];
+        this.setup();
+        this.animate();
+    }
+
+    setup() {
+        this.canvas.style.cssText = `
+            position: fixed;
+            top: 0;
+            left: 0;
+            width: 100%;
+            height: 100%;
+            pointer-events: none;
+            z-index: -1;
+            opacity: 0.6;
+        `;
+        
+        document.body.appendChild(this.canvas);
+        this.resize();
+        
+        window.addEventListener('resize', () => this.resize());
+        
+        // Create particles
+        for (let i = 0; i < 50; i++) {
+            this.particles.push({
+                x: Math.random() * this.canvas.width,
+                y: Math.random() * this.canvas.height,
+                vx: (Math.random() - 0.5) * 0.5,
+                vy: (Math.random() - 0.5) * 0.5,
+                size: Math.random() * 2 + 1
+            });
+        }
+    }
+
+    resize() {
+        this.canvas.width = window.innerWidth;
+        this.canvas.height = window.innerHeight;
+    }
+
+    animate() {
+        // Suspend entirely while the tab is hidden; resume on visibility
+        if (document.hidden) {
+            document.addEventListener('visibilitychange', () => this.animate(), { once: true });
+            return;
+        }
+
+        this.ctx.clearRect(0, 0, this.canvas.width, this.canvas.height);
+
+        // Accumulate all particles into one Path2D so the frame costs a
+        // single fill() instead of 50 beginPath/arc/fill cycles
+        const path = new Path2D();
+        this.particles.forEach(particle => {
+            particle.x += particle.vx;
+            particle.y += particle.vy;
+
+            if (particle.x < 0 || particle.x > this.canvas.width) particle.vx *= -1;
+            if (particle.y < 0 || particle.y > this.canvas.height) particle.vy *= -1;
+
+            path.moveTo(particle.x + particle.size, particle.y);
+            path.arc(particle.x, particle.y, particle.size, 0, Math.PI * 2);
+        });
+        this.ctx.fillStyle = 'rgba(102, 126, 234, 0.3)';
+        this.ctx.fill(path);
+
+        requestAnimationFrame(() => this.animate());
+    }
+}
+
+// Initialize particle system
+// new ParticleSystem(); // Uncomment if you want particle effects
\ No newline at end of file
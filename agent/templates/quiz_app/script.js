@@ -0,0 +1 @@
+// Quiz JS
\ No newline at end of file
@@ -0,0 +1 @@
+// Timer JS
\ No newline at end of file
@@ -0,0 +1,241 @@
+class TodoApp {
+    constructor() {
+        this.todos = JSON.parse(localStorage.getItem('todos')) || [];
+        this.currentFilter = 'all';
+        this._nodes = new Map();
+        this.init();
+    }
+
+    init() {
+        this.bindEvents();
+        this.render();
+        this.updateStats();
+    }
+
+    bindEvents() {
+        const addBtn = document.getElementById('add-btn');
+        const todoInput = document.getElementById('todo-input');
+        const clearBtn = document.getElementById('clear-completed');
+        const filterBtns = document.querySelectorAll('.filter-btn');
+        const todoList = document.getElementById('todo-list');
+
+        addBtn.addEventListener('click', () => this.addTodo());
+        todoInput.addEventListener('keypress', (e) => {
+            if (e.key === 'Enter') this.addTodo();
+        });
+        clearBtn.addEventListener('click', () => this.clearCompleted());
+
+        filterBtns.forEach(btn => {
+            btn.addEventListener('click', (e) => {
+                this.setFilter(e.target.dataset.filter);
+            });
+        });
+
+        // One delegated handler for the whole list instead of inline
+        // onclick attributes parsed per item on every render
+        todoList.addEventListener('click', (e) => {
+            const li = e.target.closest('[data-id]');
+            if (!li) return;
+            const id = Number(li.dataset.id);
+            const action = e.target.closest('[data-action]');
+            if (!action) return;
+            if (action.dataset.action === 'toggle') this.toggleTodo(id);
+            else if (action.dataset.action === 'edit') this.startEdit(id);
+            else if (action.dataset.action === 'delete') this.deleteTodo(id);
+        });
+    }
+
+    addTodo() {
+        const input = document.getElementById('todo-input');
+        const text = input.value.trim();
+
+        if (text) {
+            const todo = {
+                id: Date.now(),
+                text: text,
+                completed: false,
+                createdAt: new Date().toISOString()
+            };
+
+            this.todos.unshift(todo);
+            input.value = '';
+            this.saveTodos();
+            this.render();
+            this.updateStats();
+        }
+    }
+
+    toggleTodo(id) {
+        const todo = this.todos.find(t => t.id === id);
+        if (todo) {
+            todo.completed = !todo.completed;
+            this.saveTodos();
+            this.render();
+            this.updateStats();
+        }
+    }
+
+    deleteTodo(id) {
+        this.todos = this.todos.filter(t => t.id !== id);
+        this.saveTodos();
+        this.render();
+        this.updateStats();
+    }
+
+    editTodo(id, newText) {
+        const todo = this.todos.find(t => t.id === id);
+        if (todo) {
+            todo.text = newText;
+            this.saveTodos();
+            this.render();
+        }
+    }
+
+    clearCompleted() {
+        this.todos = this.todos.filter(t => !t.completed);
+        this.saveTodos();
+        this.render();
+        this.updateStats();
+    }
+
+    setFilter(filter) {
+        this.currentFilter = filter;
+        document.querySelectorAll('.filter-btn').forEach(btn => {
+            btn.classList.remove('active');
+        });
+        document.querySelector(`[data-filter="${filter}"]`).classList.add('active');
+        this.render();
+    }
+
+    getFilteredTodos() {
+        switch (this.currentFilter) {
+            case 'active':
+                return this.todos.filter(t => !t.completed);
+            case 'completed':
+                return this.todos.filter(t => t.completed);
+            default:
+                return this.todos;
+        }
+    }
+
+    render() {
+        const todoList = document.getElementById('todo-list');
+        const filteredTodos = this.getFilteredTodos();
+
+        if (filteredTodos.length === 0) {
+            this._nodes.clear();
+            todoList.innerHTML = `
+                <li class="todo-item" style="text-align: center; padding: 40px;">
+                    <span style="color: #999; font-style: italic;">
+                        ${this.currentFilter === 'completed' ? 'No completed tasks' :
+                          this.currentFilter === 'active' ? 'No active tasks' : 'No tasks yet'}
+                    </span>
+                </li>
+            `;
+            return;
+        }
+
+        // Clear a leftover empty-state message before keyed updates
+        if (this._nodes.size === 0) todoList.innerHTML = '';
+
+        // Keyed reconciliation: patch existing nodes in place, create
+        // missing ones, and walk the desired order with a cursor so every
+        // node - new or surviving - ends up at its correct position
+        const seen = new Set();
+        let cursor = todoList.firstChild;
+
+        filteredTodos.forEach(todo => {
+            seen.add(todo.id);
+            let li = this._nodes.get(todo.id);
+            if (li) {
+                li.className = `todo-item ${todo.completed ? 'completed' : ''}`;
+                li.querySelector('.todo-checkbox').classList.toggle('checked', todo.completed);
+                const text = li.querySelector('.todo-text');
+                text.classList.toggle('completed', todo.completed);
+                text.textContent = todo.text;
+            } else {
+                li = this.createTodoNode(todo);
+                this._nodes.set(todo.id, li);
+            }
+            if (li === cursor) {
+                cursor = cursor.nextSibling;
+            } else {
+                todoList.insertBefore(li, cursor);
+            }
+        });
+
+        for (const [id, li] of this._nodes) {
+            if (!seen.has(id)) {
+                li.remove();
+                this._nodes.delete(id);
+            }
+        }
+    }
+
+    createTodoNode(todo) {
+        const li = document.createElement('li');
+        li.className = `todo-item ${todo.completed ? 'completed' : ''}`;
+        li.dataset.id = todo.id;
+        li.innerHTML = `
+            <div class="todo-checkbox ${todo.completed ? 'checked' : ''}" data-action="toggle"></div>
+            <span class="todo-text ${todo.completed ? 'completed' : ''}">${todo.text}</span>
+            <div class="todo-actions">
+                <button class="action-btn edit-btn" data-action="edit" title="Edit">
+                    <i class="fas fa-edit"></i>
+                </button>
+                <button class="action-btn delete-btn" data-action="delete" title="Delete">
+                    <i class="fas fa-trash"></i>
+                </button>
+            </div>
+        `;
+        return li;
+    }
+
+    startEdit(id) {
+        const todo = this.todos.find(t => t.id === id);
+        if (todo) {
+            const newText = prompt('Edit task:', todo.text);
+            if (newText !== null && newText.trim()) {
+                this.editTodo(id, newText.trim());
+            }
+        }
+    }
+
+    updateStats() {
+        const total = this.todos.length;
+        const completed = this.todos.filter(t => t.completed).length;
+        
+        document.getElementById('total-tasks').textContent = `${total} task${total !== 1 ? 's' : ''}`;
+        document.getElementById('completed-tasks').textContent = `${completed} completed`;
+    }
+
+    saveTodos() {
+        localStorage.setItem('todos', JSON.stringify(this.todos));
+    }
+}
+
+// Initialize the app
+const app = new TodoApp();
+
+// Add some demo tasks on first load
+if (app.todos.length === 0) {
+    const demoTasks = [
+        'Welcome to your Modern Todo App! 🎉',
+        'Click the checkbox to mark tasks as complete ✅',
+        'Use the edit button to modify tasks ✏️',
+        'Filter tasks using the buttons above 🔍'
+    ];
+    
+    demoTasks.forEach(task => {
+        app.todos.push({
+            id: Date.now() + Math.random(),
+            text: task,
+            completed: false,
+            createdAt: new Date().toISOString()
+        });
+    });
+    
+    app.saveTodos();
+    app.render();
+    app.updateStats();
+}
\ No newline at end of file
@@ -2,14 +2,17 @@
 FastAPI web server for Coder Buddy dashboard and Q&A interface.
 """
 
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, HTTPException, Request, Response, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import HTMLResponse
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
+from pathlib import Path
+import aiofiles
 import asyncio
 import json
+import logging
 import uuid
 import os
 import time
@@ -21,6 +24,9 @@ from agent.qa_agent import qa_agent
 from agent.fast_qa_agent import ultra_fast_qa_agent
 from agent.instant_generator import instant_generator
 
+# Lazy %s formatting: at INFO and above the debug strings are never built
+logger = logging.getLogger("coder_buddy")
+
 app = FastAPI(title="Coder Buddy Dashboard", version="1.0.0")
 
 # CORS middleware for frontend integration
@@ -86,7 +92,7 @@ async def generate_project(request: ProjectRequest):
     start_time = time.time()
     
     try:
-        print(f"⚡ INSTANT project generation: {request.prompt}")
+        logger.debug("INSTANT project generation: %s", request.prompt)
         
         # Use instant generator for sub-second generation
         result = instant_generator.generate_instant(request.prompt)
@@ -103,7 +109,7 @@ async def generate_project(request: ProjectRequest):
         
     except Exception as e:
         error_time = (time.time() - start_time) * 1000
-        print(f"❌ Instant generation error after {error_time:.1f}ms: {str(e)}")
+        logger.error("Instant generation error after %.1fms: %s", error_time, e)
         raise HTTPException(status_code=500, detail=f"Error generating project: {str(e)}")
 
 @app.post("/api/ask-question")
@@ -127,7 +133,7 @@ async def ask_question(request: QARequest):
         }
     except Exception as e:
         error_time = (time.time() - start_time) * 1000
-        print(f"❌ Q&A error after {error_time:.1f}ms: {str(e)}")
+        logger.error("Q&A error after %.1fms: %s", error_time, e)
         raise HTTPException(status_code=500, detail=f"Error processing question: {str(e)}")
 
 @app.get("/api/sessions")
@@ -159,50 +165,60 @@ async def get_session(session_id: str):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching session: {str(e)}")
 
+_EXT_TO_TYPE = {".html": "HTML", ".css": "CSS", ".js": "JavaScript", ".py": "Python"}
+
+# Bounds concurrent preview reads so a huge directory cannot exhaust fds
+_PREVIEW_SEM = asyncio.Semaphore(32)
+
+def _preview_sync(path: str) -> str:
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read(300)  # First 300 chars
+    return content + ("..." if len(content) == 300 else "")
+
+async def _preview(path: str) -> str:
+    async with _PREVIEW_SEM:
+        return await asyncio.to_thread(_preview_sync, path)
+
 @app.get("/api/generated-projects")
 async def get_generated_projects():
     """Get list of generated projects with enhanced details."""
     try:
         project_root = "/app/generated_project"
         projects = []
-        
+
+        # scandir yields name/type/stat in one pass instead of a
+        # listdir + isfile/getsize/getmtime syscall per entry
         if os.path.exists(project_root):
-            for item in os.listdir(project_root):
-                item_path = os.path.join(project_root, item)
-                if os.path.isfile(item_path):
-                    try:
-                        # Get file preview
-                        with open(item_path, 'r', encoding='utf-8') as f:
-                            content = f.read(300)  # First 300 chars
-                        
-                        # Determine file type
-                        file_type = "unknown"
-                        if item.endswith('.html'):
-                            file_type = "HTML"
-                        elif item.endswith('.css'):
-                            file_type = "CSS"
-                        elif item.endswith('.js'):
-                            file_type = "JavaScript"
-                        elif item.endswith('.py'):
-                            file_type = "Python"
-                        
-                        projects.append({
-                            "name": item,
-                            "path": item_path,
-                            "type": file_type,
-                            "preview": content + ("..." if len(content) == 300 else ""),
-                            "size": os.path.getsize(item_path),
-                            "modified": os.path.getmtime(item_path)
-                        })
-                    except Exception:
-                        projects.append({
-                            "name": item,
-                            "path": item_path,
-                            "type": "unknown",
-                            "preview": "Preview not available",
-                            "size": 0,
-                            "modified": 0
-                        })
+            with os.scandir(project_root) as it:
+                entries = [entry for entry in it if entry.is_file()]
+
+            # Read all previews concurrently; per-file storage latency
+            # overlaps instead of accumulating serially
+            previews = await asyncio.gather(
+                *[_preview(entry.path) for entry in entries],
+                return_exceptions=True
+            )
+
+            for entry, preview in zip(entries, previews):
+                if isinstance(preview, Exception):
+                    projects.append({
+                        "name": entry.name,
+                        "path": entry.path,
+                        "type": "unknown",
+                        "preview": "Preview not available",
+                        "size": 0,
+                        "modified": 0
+                    })
+                    continue
+                stat = entry.stat()
+                projects.append({
+                    "name": entry.name,
+                    "path": entry.path,
+                    "type": _EXT_TO_TYPE.get(os.path.splitext(entry.name)[1], "unknown"),
+                    "preview": preview,
+                    "size": stat.st_size,
+                    "modified": stat.st_mtime
+                })
         
         return {
             "success": True,
@@ -212,25 +228,46 @@ async def get_generated_projects():
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching projects: {str(e)}")
 
+# Resolved once; the check below defeats `..` traversal that a raw
+# startswith prefix compare would let through
+_BASE = Path("/app/generated_project").resolve()
+
+def _safe(path: str) -> Path:
+    """Resolve a client-supplied path and reject anything outside _BASE."""
+    p = Path(path).resolve()
+    if _BASE not in p.parents and p != _BASE:
+        raise HTTPException(status_code=403, detail="Access denied")
+    return p
+
 @app.get("/api/file-content")
-async def get_file_content(path: str):
+async def get_file_content(path: str, request: Request, response: Response):
     """Get content of a specific file."""
     try:
         # Security check - ensure path is within project directory
-        if not path.startswith("/app/generated_project/"):
-            raise HTTPException(status_code=403, detail="Access denied")
-        
-        if not os.path.exists(path):
+        path = str(_safe(path))
+
+        try:
+            stat = await asyncio.to_thread(os.stat, path)
+        except FileNotFoundError:
             raise HTTPException(status_code=404, detail="File not found")
-        
-        with open(path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
+
+        # ETag from (mtime, size) lets the editor 304 unchanged files
+        etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304)
+        response.headers["ETag"] = etag
+
+        # Async read keeps the event loop free for other requests
+        async with aiofiles.open(path, 'r', encoding='utf-8') as f:
+            content = await f.read()
+
         return {
             "success": True,
             "content": content,
             "path": path
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error reading file: {str(e)}")
 
@@ -240,25 +277,26 @@ async def save_file(request: dict):
     try:
         path = request.get("path")
         content = request.get("content")
-        
+
         if not path or content is None:
             raise HTTPException(status_code=400, detail="Path and content are required")
-        
+
         # Security check - ensure path is within project directory
-        if not path.startswith("/app/generated_project/"):
-            raise HTTPException(status_code=403, detail="Access denied")
-        
-        # Create directory if it doesn't exist
-        os.makedirs(os.path.dirname(path), exist_ok=True)
-        
-        with open(path, 'w', encoding='utf-8') as f:
-            f.write(content)
-        
+        path = str(_safe(path))
+
+        # Create directory if it doesn't exist; off the loop like the write
+        await asyncio.to_thread(os.makedirs, os.path.dirname(path), exist_ok=True)
+
+        async with aiofiles.open(path, 'w', encoding='utf-8') as f:
+            await f.write(content)
+
         return {
             "success": True,
             "message": "File saved successfully",
             "path": path
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error saving file: {str(e)}")
 
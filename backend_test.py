@@ -4,262 +4,334 @@ Comprehensive Backend API Testing for Coder Buddy Dashboard
 Tests all API endpoints with both technical and general questions/requests
 """
 
-import requests
+import asyncio
+import httpx
 import sys
 import json
 import time
+from dataclasses import asdict, dataclass
 from datetime import datetime
 
+@dataclass
+class TestResult:
+    name: str
+    passed: bool
+    details: str
+    elapsed: float
+
 class CoderBuddyAPITester:
     def __init__(self, base_url="https://61db40e8-9f3b-4fec-98f9-e45598a1d133.preview.emergentagent.com"):
         self.base_url = base_url
-        self.tests_run = 0
-        self.tests_passed = 0
+        self.results = []
         self.session_timeout = 30  # seconds to wait for AI responses
 
-    def log_test(self, name, success, details=""):
-        """Log test results"""
-        self.tests_run += 1
-        if success:
-            self.tests_passed += 1
-            print(f"✅ {name} - PASSED")
-        else:
-            print(f"❌ {name} - FAILED")
-        
-        if details:
-            print(f"   Details: {details}")
-        print()
+    def log_test(self, name, success, details="", elapsed=0.0):
+        """Record a test result; the report is rendered once at the end."""
+        self.results.append(TestResult(name, success, details, elapsed))
 
-    def test_health_check(self):
+    async def test_health_check(self, client):
         """Test the health check endpoint"""
-        print("🔍 Testing Health Check Endpoint...")
+        start = time.perf_counter()
         try:
-            response = requests.get(f"{self.base_url}/api/health", timeout=10)
-            
+            response = await client.get("/api/health", timeout=10)
+
             if response.status_code == 200:
                 data = response.json()
                 if data.get("status") == "healthy" and "service" in data:
-                    self.log_test("Health Check", True, f"Status: {data['status']}, Service: {data['service']}")
+                    self.log_test("Health Check", True,
+                                f"Status: {data['status']}, Service: {data['service']}",
+                                time.perf_counter() - start)
                     return True
                 else:
-                    self.log_test("Health Check", False, f"Unexpected response format: {data}")
+                    self.log_test("Health Check", False, f"Unexpected response format: {data}",
+                                time.perf_counter() - start)
             else:
-                self.log_test("Health Check", False, f"HTTP {response.status_code}: {response.text}")
+                self.log_test("Health Check", False, f"HTTP {response.status_code}: {response.text}",
+                            time.perf_counter() - start)
         except Exception as e:
-            self.log_test("Health Check", False, f"Exception: {str(e)}")
+            self.log_test("Health Check", False, f"Exception: {str(e)}",
+                        time.perf_counter() - start)
         return False
 
-    def test_qa_technical_question(self):
+    async def test_qa_technical_question(self, client):
         """Test Q&A with a technical programming question"""
-        print("🔍 Testing Q&A - Technical Question...")
+        start = time.perf_counter()
         try:
             question = "How do I use async/await in JavaScript?"
             payload = {
                 "question": question,
                 "context": ""
             }
-            
-            response = requests.post(
-                f"{self.base_url}/api/ask-question", 
-                json=payload, 
+
+            response = await client.post(
+                "/api/ask-question",
+                json=payload,
                 timeout=self.session_timeout
             )
-            
+
             if response.status_code == 200:
                 data = response.json()
-                if (data.get("success") and 
-                    "answer" in data and 
+                if (data.get("success") and
+                    "answer" in data and
                     data.get("question") == question and
                     len(data["answer"]) > 50):  # Reasonable answer length
-                    
+
                     is_technical = data.get("is_technical", False)
-                    self.log_test("Q&A Technical Question", True, 
-                                f"Technical: {is_technical}, Answer length: {len(data['answer'])} chars")
+                    self.log_test("Q&A Technical Question", True,
+                                f"Technical: {is_technical}, Answer length: {len(data['answer'])} chars",
+                                time.perf_counter() - start)
                     return True
                 else:
-                    self.log_test("Q&A Technical Question", False, f"Invalid response: {data}")
+                    self.log_test("Q&A Technical Question", False, f"Invalid response: {data}",
+                                time.perf_counter() - start)
             else:
-                self.log_test("Q&A Technical Question", False, f"HTTP {response.status_code}: {response.text}")
+                self.log_test("Q&A Technical Question", False, f"HTTP {response.status_code}: {response.text}",
+                            time.perf_counter() - start)
         except Exception as e:
-            self.log_test("Q&A Technical Question", False, f"Exception: {str(e)}")
+            self.log_test("Q&A Technical Question", False, f"Exception: {str(e)}",
+                        time.perf_counter() - start)
         return False
 
-    def test_qa_general_question(self):
+    async def test_qa_general_question(self, client):
         """Test Q&A with a general knowledge question"""
-        print("🔍 Testing Q&A - General Question...")
+        start = time.perf_counter()
         try:
             question = "What is artificial intelligence?"
             payload = {
                 "question": question,
                 "context": ""
             }
-            
-            response = requests.post(
-                f"{self.base_url}/api/ask-question", 
-                json=payload, 
+
+            response = await client.post(
+                "/api/ask-question",
+                json=payload,
                 timeout=self.session_timeout
             )
-            
+
             if response.status_code == 200:
                 data = response.json()
-                if (data.get("success") and 
-                    "answer" in data and 
+                if (data.get("success") and
+                    "answer" in data and
                     data.get("question") == question and
                     len(data["answer"]) > 50):
-                    
+
                     is_technical = data.get("is_technical", False)
-                    self.log_test("Q&A General Question", True, 
-                                f"Technical: {is_technical}, Answer length: {len(data['answer'])} chars")
+                    self.log_test("Q&A General Question", True,
+                                f"Technical: {is_technical}, Answer length: {len(data['answer'])} chars",
+                                time.perf_counter() - start)
                     return True
                 else:
-                    self.log_test("Q&A General Question", False, f"Invalid response: {data}")
+                    self.log_test("Q&A General Question", False, f"Invalid response: {data}",
+                                time.perf_counter() - start)
             else:
-                self.log_test("Q&A General Question", False, f"HTTP {response.status_code}: {response.text}")
+                self.log_test("Q&A General Question", False, f"HTTP {response.status_code}: {response.text}",
+                            time.perf_counter() - start)
         except Exception as e:
-            self.log_test("Q&A General Question", False, f"Exception: {str(e)}")
+            self.log_test("Q&A General Question", False, f"Exception: {str(e)}",
+                        time.perf_counter() - start)
         return False
 
-    def test_project_generation(self):
+    async def test_project_generation(self, client):
         """Test project generation with a simple request"""
-        print("🔍 Testing Project Generation...")
+        start = time.perf_counter()
         try:
             prompt = "Create a simple contact form with HTML, CSS, and JavaScript"
             payload = {
                 "prompt": prompt
             }
-            
-            print(f"   Generating project with prompt: '{prompt}'")
-            print("   ⏳ This may take 30-60 seconds for AI processing...")
-            
-            response = requests.post(
-                f"{self.base_url}/api/generate-project", 
-                json=payload, 
+
+            response = await client.post(
+                "/api/generate-project",
+                json=payload,
                 timeout=60  # Longer timeout for project generation
             )
-            
+
             if response.status_code == 200:
                 data = response.json()
                 if data.get("success") and "result" in data:
                     session_info = data.get("session_info", {})
-                    self.log_test("Project Generation", True, 
-                                f"Message: {data.get('message', 'N/A')}, Session: {session_info.get('session_id', 'N/A')[:8]}...")
+                    self.log_test("Project Generation", True,
+                                f"Message: {data.get('message', 'N/A')}, Session: {session_info.get('session_id', 'N/A')[:8]}...",
+                                time.perf_counter() - start)
                     return True
                 else:
-                    self.log_test("Project Generation", False, f"Invalid response: {data}")
+                    self.log_test("Project Generation", False, f"Invalid response: {data}",
+                                time.perf_counter() - start)
             else:
-                self.log_test("Project Generation", False, f"HTTP {response.status_code}: {response.text}")
+                self.log_test("Project Generation", False, f"HTTP {response.status_code}: {response.text}",
+                            time.perf_counter() - start)
         except Exception as e:
-            self.log_test("Project Generation", False, f"Exception: {str(e)}")
+            self.log_test("Project Generation", False, f"Exception: {str(e)}",
+                        time.perf_counter() - start)
         return False
 
-    def test_sessions_endpoint(self):
+    async def test_sessions_endpoint(self, client):
         """Test sessions monitoring endpoint"""
-        print("🔍 Testing Sessions Endpoint...")
+        start = time.perf_counter()
         try:
-            response = requests.get(f"{self.base_url}/api/sessions", timeout=10)
-            
+            response = await client.get("/api/sessions", timeout=10)
+
             if response.status_code == 200:
                 data = response.json()
                 if data.get("success") and "sessions" in data:
                     sessions = data["sessions"]
-                    self.log_test("Sessions Endpoint", True, 
-                                f"Found {len(sessions)} sessions")
+                    self.log_test("Sessions Endpoint", True,
+                                f"Found {len(sessions)} sessions",
+                                time.perf_counter() - start)
                     return True
                 else:
-                    self.log_test("Sessions Endpoint", False, f"Invalid response format: {data}")
+                    self.log_test("Sessions Endpoint", False, f"Invalid response format: {data}",
+                                time.perf_counter() - start)
             else:
-                self.log_test("Sessions Endpoint", False, f"HTTP {response.status_code}: {response.text}")
+                self.log_test("Sessions Endpoint", False, f"HTTP {response.status_code}: {response.text}",
+                            time.perf_counter() - start)
         except Exception as e:
-            self.log_test("Sessions Endpoint", False, f"Exception: {str(e)}")
+            self.log_test("Sessions Endpoint", False, f"Exception: {str(e)}",
+                        time.perf_counter() - start)
         return False
 
-    def test_generated_projects_endpoint(self):
+    async def test_generated_projects_endpoint(self, client):
         """Test generated projects gallery endpoint"""
-        print("🔍 Testing Generated Projects Endpoint...")
+        start = time.perf_counter()
         try:
-            response = requests.get(f"{self.base_url}/api/generated-projects", timeout=10)
-            
+            response = await client.get("/api/generated-projects", timeout=10)
+
             if response.status_code == 200:
                 data = response.json()
                 if data.get("success") and "projects" in data:
                     projects = data["projects"]
-                    self.log_test("Generated Projects Endpoint", True, 
-                                f"Found {len(projects)} projects")
+                    self.log_test("Generated Projects Endpoint", True,
+                                f"Found {len(projects)} projects",
+                                time.perf_counter() - start)
                     return True
                 else:
-                    self.log_test("Generated Projects Endpoint", False, f"Invalid response format: {data}")
+                    self.log_test("Generated Projects Endpoint", False, f"Invalid response format: {data}",
+                                time.perf_counter() - start)
             else:
-                self.log_test("Generated Projects Endpoint", False, f"HTTP {response.status_code}: {response.text}")
+                self.log_test("Generated Projects Endpoint", False, f"HTTP {response.status_code}: {response.text}",
+                            time.perf_counter() - start)
         except Exception as e:
-            self.log_test("Generated Projects Endpoint", False, f"Exception: {str(e)}")
+            self.log_test("Generated Projects Endpoint", False, f"Exception: {str(e)}",
+                        time.perf_counter() - start)
         return False
 
-    def test_root_endpoint(self):
+    async def test_root_endpoint(self, client):
         """Test root endpoint (should serve frontend HTML)"""
-        print("🔍 Testing Root Endpoint...")
+        start = time.perf_counter()
         try:
-            response = requests.get(f"{self.base_url}/", timeout=10)
-            
+            response = await client.get("/", timeout=10)
+
             if response.status_code == 200:
                 # Root endpoint should serve HTML for frontend, not JSON
                 content = response.text
                 if "Coder Buddy" in content and "<!DOCTYPE html>" in content:
-                    self.log_test("Root Endpoint", True, "Serves frontend HTML correctly")
+                    self.log_test("Root Endpoint", True, "Serves frontend HTML correctly",
+                                time.perf_counter() - start)
                     return True
                 else:
-                    self.log_test("Root Endpoint", False, f"Unexpected HTML content")
+                    self.log_test("Root Endpoint", False, f"Unexpected HTML content",
+                                time.perf_counter() - start)
             else:
-                self.log_test("Root Endpoint", False, f"HTTP {response.status_code}: {response.text}")
+                self.log_test("Root Endpoint", False, f"HTTP {response.status_code}: {response.text}",
+                            time.perf_counter() - start)
         except Exception as e:
-            self.log_test("Root Endpoint", False, f"Exception: {str(e)}")
+            self.log_test("Root Endpoint", False, f"Exception: {str(e)}",
+                        time.perf_counter() - start)
         return False
 
-    def run_all_tests(self):
+    def print_report(self, as_json=False):
+        """Render the whole run as one write instead of a print per line."""
+        if as_json:
+            sys.stdout.write(json.dumps([asdict(r) for r in self.results], indent=2) + "\n")
+            return
+
+        tests_passed = sum(1 for r in self.results if r.passed)
+        tests_run = len(self.results)
+        lines = []
+        for r in self.results:
+            status = "✅" if r.passed else "❌"
+            lines.append(f"{status} {r.name} - {'PASSED' if r.passed else 'FAILED'} ({r.elapsed:.2f}s)")
+            if r.details:
+                lines.append(f"   Details: {r.details}")
+            lines.append("")
+
+        # Slowest endpoints first: these are the next optimization targets
+        slowest = sorted(self.results, key=lambda r: r.elapsed, reverse=True)[:3]
+        lines.append("=" * 60)
+        lines.append("📊 TEST SUMMARY")
+        lines.append("=" * 60)
+        lines.append(f"✅ Tests Passed: {tests_passed}/{tests_run}")
+        lines.append(f"❌ Tests Failed: {tests_run - tests_passed}/{tests_run}")
+
+        success_rate = (tests_passed / tests_run) * 100 if tests_run > 0 else 0
+        lines.append(f"📈 Success Rate: {success_rate:.1f}%")
+        lines.append("🐢 Slowest: " + ", ".join(f"{r.name} ({r.elapsed:.2f}s)" for r in slowest))
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    @property
+    def success_rate(self):
+        if not self.results:
+            return 0
+        return sum(1 for r in self.results if r.passed) / len(self.results) * 100
+
+    async def run_all_tests_async(self, as_json=False):
         """Run all backend API tests"""
-        print("🚀 Starting Coder Buddy Backend API Tests")
-        print("=" * 60)
-        print(f"🌐 Testing against: {self.base_url}")
-        print(f"⏰ Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print("=" * 60)
-        print()
-
-        # Test basic connectivity first
-        if not self.test_health_check():
-            print("❌ Health check failed - stopping tests")
-            return False
+        if not as_json:
+            print("🚀 Starting Coder Buddy Backend API Tests")
+            print("=" * 60)
+            print(f"🌐 Testing against: {self.base_url}")
+            print(f"⏰ Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+            print("=" * 60)
+            print()
 
-        # Test all endpoints
-        self.test_root_endpoint()
-        self.test_qa_technical_question()
-        self.test_qa_general_question()
-        self.test_sessions_endpoint()
-        self.test_generated_projects_endpoint()
-        
-        # Test project generation last (takes longest)
-        self.test_project_generation()
-
-        # Print summary
-        print("=" * 60)
-        print("📊 TEST SUMMARY")
-        print("=" * 60)
-        print(f"✅ Tests Passed: {self.tests_passed}/{self.tests_run}")
-        print(f"❌ Tests Failed: {self.tests_run - self.tests_passed}/{self.tests_run}")
-        
-        success_rate = (self.tests_passed / self.tests_run) * 100 if self.tests_run > 0 else 0
-        print(f"📈 Success Rate: {success_rate:.1f}%")
-        
-        if success_rate >= 80:
-            print("🎉 Backend API tests mostly successful!")
+        # One pooled client: connections (and the TLS handshake) are
+        # shared by every test instead of re-established per request
+        async with httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=self.session_timeout,
+            limits=httpx.Limits(max_keepalive_connections=8)
+        ) as client:
+            # Test basic connectivity first
+            if not await self.test_health_check(client):
+                self.print_report(as_json)
+                if not as_json:
+                    print("❌ Health check failed - stopping tests")
+                return False
+
+            # The remaining endpoints are independent, so run them
+            # concurrently - wall time collapses to the slowest call
+            # (the Q&A model latency) instead of the sum of all of them
+            await asyncio.gather(
+                self.test_root_endpoint(client),
+                self.test_qa_technical_question(client),
+                self.test_qa_general_question(client),
+                self.test_sessions_endpoint(client),
+                self.test_generated_projects_endpoint(client)
+            )
+
+            # Test project generation last (takes longest)
+            await self.test_project_generation(client)
+
+        self.print_report(as_json)
+
+        if self.success_rate >= 80:
+            if not as_json:
+                print("🎉 Backend API tests mostly successful!")
             return True
         else:
-            print("⚠️  Backend API has significant issues that need attention")
+            if not as_json:
+                print("⚠️  Backend API has significant issues that need attention")
             return False
 
+    def run_all_tests(self, as_json=False):
+        """Synchronous entry point for the async test run."""
+        return asyncio.run(self.run_all_tests_async(as_json))
+
 def main():
     """Main test execution"""
     tester = CoderBuddyAPITester()
-    success = tester.run_all_tests()
+    success = tester.run_all_tests(as_json="--json" in sys.argv[1:])
     return 0 if success else 1
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())
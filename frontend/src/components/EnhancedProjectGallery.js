@@ -35,7 +35,26 @@ const EnhancedProjectGallery = () => {
       const response = await fetch('/api/generated-projects');
       if (response.ok) {
         const data = await response.json();
-        setProjects(data.projects || []);
+        // The listing is metadata-only; pull each file's preview from the
+        // per-project endpoint before rendering the cards
+        const projectList = await Promise.all(
+          (data.projects || []).map(async (project) => {
+            if (project.type !== 'file') return project;
+            try {
+              const res = await fetch(
+                `/api/generated-projects/${encodeURIComponent(project.name)}/preview`
+              );
+              if (res.ok) {
+                const previewData = await res.json();
+                return { ...project, preview: previewData.preview };
+              }
+            } catch (error) {
+              console.error('Error fetching preview:', error);
+            }
+            return project;
+          })
+        );
+        setProjects(projectList);
       }
     } catch (error) {
       console.error('Error fetching projects:', error);
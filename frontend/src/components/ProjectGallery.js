@@ -16,6 +16,7 @@ import {
 
 const ProjectGallery = () => {
   const [projects, setProjects] = useState([]);
+  const [previews, setPreviews] = useState({});
   const [selectedProject, setSelectedProject] = useState(null);
   const [isLoading, setIsLoading] = useState(true);
   const [lastUpdate, setLastUpdate] = useState(new Date());
@@ -29,9 +30,10 @@ const ProjectGallery = () => {
     try {
       const response = await fetch('/api/generated-projects');
       const data = await response.json();
-      
+
       if (data.success) {
         setProjects(data.projects);
+        setPreviews({});
         setLastUpdate(new Date());
       }
     } catch (error) {
@@ -41,6 +43,31 @@ const ProjectGallery = () => {
     }
   };
 
+  // The listing is metadata-only; previews are fetched on demand when a
+  // file card is expanded
+  const loadPreview = async (project) => {
+    if (project.type !== 'file' || previews[project.name] !== undefined) return;
+    try {
+      const response = await fetch(
+        `/api/generated-projects/${encodeURIComponent(project.name)}/preview`
+      );
+      const data = await response.json();
+      if (data.success) {
+        setPreviews((prev) => ({ ...prev, [project.name]: data.preview }));
+      }
+    } catch (error) {
+      console.error('Failed to fetch preview:', error);
+    }
+  };
+
+  const toggleProject = (project) => {
+    const next = selectedProject === project ? null : project;
+    setSelectedProject(next);
+    if (next) {
+      loadPreview(project);
+    }
+  };
+
   const getFileIcon = (fileName) => {
     const extension = fileName.split('.').pop()?.toLowerCase();
     
@@ -69,11 +96,9 @@ const ProjectGallery = () => {
     }
   };
 
-  const formatFileSize = (content) => {
-    if (!content) return '0 B';
-    const bytes = new Blob([content]).size;
+  const formatFileSize = (bytes) => {
+    if (!bytes) return '0 B';
     const sizes = ['B', 'KB', 'MB'];
-    if (bytes === 0) return '0 B';
     const i = parseInt(Math.floor(Math.log(bytes) / Math.log(1024)));
     return Math.round(bytes / Math.pow(1024, i) * 100) / 100 + ' ' + sizes[i];
   };
@@ -159,7 +184,7 @@ const ProjectGallery = () => {
               <motion.div
                 key={index}
                 className="bg-white rounded-xl border border-gray-100 shadow-sm hover:shadow-md transition-all cursor-pointer"
-                onClick={() => setSelectedProject(selectedProject === project ? null : project)}
+                onClick={() => toggleProject(project)}
                 whileHover={{ y: -4 }}
                 initial={{ opacity: 0, y: 20 }}
                 animate={{ opacity: 1, y: 0 }}
@@ -181,7 +206,7 @@ const ProjectGallery = () => {
                       
                       {project.type === 'file' && (
                         <div className="text-xs text-gray-400">
-                          Size: {formatFileSize(project.preview)}
+                          Size: {formatFileSize(project.size)}
                         </div>
                       )}
                       
@@ -219,12 +244,12 @@ const ProjectGallery = () => {
                           </p>
                         </div>
 
-                        {project.type === 'file' && project.preview && (
+                        {project.type === 'file' && previews[project.name] && (
                           <div>
                             <h4 className="text-sm font-medium text-gray-700 mb-2">Preview</h4>
                             <div className="bg-gray-50 rounded-lg p-3 max-h-32 overflow-y-auto">
                               <pre className="text-xs text-gray-600 whitespace-pre-wrap">
-                                {project.preview}
+                                {previews[project.name]}
                               </pre>
                             </div>
                           </div>
@@ -1,25 +1,31 @@
 import json
 from flask import request, jsonify
-from functions import read_file, write_file
+
+FORMS_FILE = 'forms.jsonl'
+
+# In-memory index by id, populated once by streaming the append-only log
+forms = {}
+try:
+    with open(FORMS_FILE, 'r') as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                forms[record['id']] = record
+except FileNotFoundError:
+    pass
+
+# Opened once; every insert is a single buffered append instead of
+# re-reading and re-serializing the whole store
+formsLog = open(FORMS_FILE, 'a', buffering=8192)
 
 def storeFormData():
     # Get form data from the request
     formData = request.get_json()
 
-    # Read existing form data from file
-    existingData = read_file('forms.json')
-    if existingData:
-        # Load existing data into a JSON object
-        data = json.loads(existingData)
-    else:
-        # Initialize empty JSON object
-        data = {}
-
-    # Store new form data
-    data[formData['id']] = formData
-
-    # Write updated data to file
-    write_file('forms.json', json.dumps(data))
+    # Store new form data in the index and append it to the log
+    forms[formData['id']] = formData
+    formsLog.write(json.dumps(formData) + '\n')
+    formsLog.flush()
 
     # Return success response
     return jsonify({'message': 'Data stored successfully'}), 200
@@ -28,4 +34,4 @@ if __name__ == '__main__':
     from flask import Flask
     app = Flask(__name__)
     app.route('/storeFormData', methods=['POST'])(storeFormData)
-    app.run(debug=True)
\ No newline at end of file
+    app.run(debug=True)
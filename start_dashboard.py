@@ -4,70 +4,92 @@ Startup script for Coder Buddy Dashboard
 Runs both FastAPI backend and React frontend
 """
 
-import subprocess
+import asyncio
 import sys
-import time
 import os
-import threading
 from pathlib import Path
 
-def run_backend():
-    """Run the FastAPI backend server"""
+import httpx
+
+async def run_backend():
+    """Run the FastAPI backend server in-process.
+
+    Serving the app directly avoids forking a second interpreter and
+    paying the langchain/fastapi import cost twice; uvloop and httptools
+    replace the pure-Python event loop and HTTP parser.
+    """
     print("🚀 Starting FastAPI backend server...")
-    try:
-        subprocess.run([
-            sys.executable, "-m", "uvicorn", 
-            "web_server:app", 
-            "--host", "0.0.0.0", 
-            "--port", "8000", 
-            "--reload"
-        ], cwd="/app")
-    except KeyboardInterrupt:
-        print("Backend server stopped.")
+    import uvicorn
+    from web_server import app
+
+    config = uvicorn.Config(
+        app, host="0.0.0.0", port=8000,
+        loop="uvloop", http="httptools"
+    )
+    await uvicorn.Server(config).serve()
 
-def run_frontend():
+async def wait_for_backend(timeout: float = 30.0) -> bool:
+    """Poll the health endpoint until the backend answers or time runs out.
+
+    Replaces the old fixed 3-second sleep: the frontend starts the moment
+    the backend is actually ready, and we fail fast if it never comes up.
+    """
+    async with httpx.AsyncClient() as client:
+        deadline = asyncio.get_running_loop().time() + timeout
+        while asyncio.get_running_loop().time() < deadline:
+            try:
+                response = await client.get("http://127.0.0.1:8000/api/health", timeout=0.5)
+                if response.status_code == 200:
+                    return True
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(0.1)
+    return False
+
+async def run_frontend():
     """Run the React frontend development server"""
     print("🎨 Starting React frontend server...")
-    try:
-        env = os.environ.copy()
-        env['PORT'] = '3000'
-        subprocess.run([
-            "yarn", "start"
-        ], cwd="/app/frontend", env=env)
-    except KeyboardInterrupt:
-        print("Frontend server stopped.")
+    env = os.environ.copy()
+    env['PORT'] = '3000'
+    process = await asyncio.create_subprocess_exec(
+        "yarn", "start", cwd="/app/frontend", env=env
+    )
+    await process.wait()
+
+async def run_dashboard():
+    backend = asyncio.create_task(run_backend())
+
+    if not await wait_for_backend():
+        print("❌ Backend did not become healthy - aborting startup")
+        backend.cancel()
+        return
+
+    print("✅ Backend is healthy")
+    await run_frontend()
 
 def main():
     print("🛠️  Starting Coder Buddy Dashboard")
     print("=" * 50)
-    
+
     # Check if required directories exist
     if not Path("/app/frontend").exists():
         print("❌ Frontend directory not found!")
         return
-    
+
     if not Path("/app/.env").exists():
         print("❌ .env file not found! Please create it with your GOOGLE_API_KEY")
         return
-    
+
     print("✅ All required files found")
     print("📡 Backend will run on: http://localhost:8000")
     print("🌐 Frontend will run on: http://localhost:3000")
     print("=" * 50)
-    
-    # Start backend in a separate thread
-    backend_thread = threading.Thread(target=run_backend, daemon=True)
-    backend_thread.start()
-    
-    # Give backend time to start
-    time.sleep(3)
-    
-    # Start frontend (this will block)
+
     try:
-        run_frontend()
+        asyncio.run(run_dashboard())
     except KeyboardInterrupt:
         print("\n🛑 Shutting down Coder Buddy Dashboard...")
         print("Thanks for using Coder Buddy! 👋")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -2,14 +2,16 @@
 FastAPI web server for Coder Buddy dashboard and Q&A interface.
 """
 
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, HTTPException, Response, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse
+from starlette.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, HTMLResponse, ORJSONResponse
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
 import asyncio
-import json
+import functools
+import orjson
 import uuid
 import os
 import time
@@ -22,7 +24,10 @@ from agent.fast_qa_agent import ultra_fast_qa_agent
 from agent.fast_project_generator import fast_project_generator
 from agent.instant_generator import instant_generator
 
-app = FastAPI(title="Coder Buddy Dashboard", version="1.0.0")
+# ORJSONResponse serializes every endpoint's payload through orjson's C
+# encoder instead of the stdlib json module
+app = FastAPI(title="Coder Buddy Dashboard", version="1.0.0",
+              default_response_class=ORJSONResponse)
 
 # CORS middleware for frontend integration
 app.add_middleware(
@@ -41,6 +46,9 @@ class QARequest(BaseModel):
     question: str
     context: Optional[str] = ""
 
+class QABatchRequest(BaseModel):
+    questions: List[QARequest]
+
 class ChatMessage(BaseModel):
     message: str
     type: str  # 'user' or 'assistant'
@@ -48,25 +56,54 @@ class ChatMessage(BaseModel):
 
 # WebSocket connection manager
 class ConnectionManager:
+    """Fans broadcasts out through a bounded queue per client.
+
+    Each connection drains its own queue in a dedicated sender task, so a
+    slow client backs up only its queue (dropping its oldest updates)
+    instead of stalling every other client.
+    """
+
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Dict[WebSocket, asyncio.Queue] = {}
+        self.dropped_messages = 0
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=64)
+        self.active_connections[websocket] = queue
+        asyncio.create_task(self._sender(websocket, queue))
 
     def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
+        queue = self.active_connections.pop(websocket, None)
+        if queue is not None:
+            # Wake the sender with a shutdown sentinel so it exits instead
+            # of blocking on an empty queue forever; the client is gone, so
+            # dropping one backlogged message to make room is fine
+            try:
+                queue.put_nowait(None)
+            except asyncio.QueueFull:
+                queue.get_nowait()
+                queue.put_nowait(None)
 
     async def send_personal_message(self, message: str, websocket: WebSocket):
         await websocket.send_text(message)
 
-    async def broadcast(self, message: str):
-        for connection in self.active_connections:
+    async def _sender(self, websocket: WebSocket, queue: asyncio.Queue):
+        try:
+            while True:
+                message = await queue.get()
+                if message is None:  # disconnect sentinel
+                    break
+                await websocket.send_text(message)
+        except Exception:
+            self.disconnect(websocket)
+
+    def broadcast(self, message: str):
+        for queue in self.active_connections.values():
             try:
-                await connection.send_text(message)
-            except:
-                pass
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                self.dropped_messages += 1
 
 manager = ConnectionManager()
 
@@ -89,8 +126,9 @@ async def generate_project(request: ProjectRequest):
     try:
         print(f"⚡ INSTANT project generation: {request.prompt}")
         
-        # Use instant generator for sub-second generation
-        result = instant_generator.generate_instant(request.prompt)
+        # Instant generation is sync (template extraction hits the disk),
+        # so run it on the threadpool to keep the event loop responsive
+        result = await run_in_threadpool(instant_generator.generate_instant, request.prompt)
         
         total_time = (time.time() - start_time) * 1000
         
@@ -157,15 +195,75 @@ async def ask_question(request: QARequest):
         print(f"❌ Q&A error after {error_time:.1f}ms: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error processing question: {str(e)}")
 
-@app.get("/api/sessions")
-async def get_sessions():
-    """Get recent workflow sessions."""
+@app.post("/api/ask-questions")
+async def ask_questions(request: QABatchRequest):
+    """Answer a batch of questions in one round-trip.
+
+    The batch pays a single HTTP/TLS exchange and the answers overlap on
+    the server; in-flight deduplication in the agent collapses duplicate
+    questions within the batch to one LLM call.
+    """
+    if len(request.questions) > 32:
+        raise HTTPException(status_code=400, detail="Batch size is limited to 32 questions")
+    start_time = time.time()
+
     try:
-        sessions = workflow_monitor.get_recent_sessions(limit=20)
+        answers = await asyncio.gather(
+            *[ultra_fast_qa_agent.answer_question_async(q.question, q.context)
+              for q in request.questions]
+        )
+
+        response_time = (time.time() - start_time) * 1000
+
         return {
             "success": True,
-            "sessions": [workflow_monitor._session_to_dict(session) for session in sessions]
+            "answers": [
+                {
+                    "question": q.question,
+                    "answer": answer,
+                    "is_technical": ultra_fast_qa_agent.is_technical_question(q.question)
+                }
+                for q, answer in zip(request.questions, answers)
+            ],
+            "response_time_ms": round(response_time, 2),
+            "optimized": True
         }
+    except Exception as e:
+        error_time = (time.time() - start_time) * 1000
+        print(f"❌ Batch Q&A error after {error_time:.1f}ms: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error processing questions: {str(e)}")
+
+@app.post("/api/cache/clear")
+async def clear_qa_cache():
+    """Invalidate the Q&A answer cache (all tiers)."""
+    await asyncio.to_thread(ultra_fast_qa_agent.cache.clear)
+    return {"success": True, "message": "Q&A cache cleared"}
+
+# Serialized /api/sessions body, valid for a short window between polls
+# and invalidated eagerly on workflow events
+_SESSIONS_TTL = 0.5
+_sessions_cache: Dict[str, Any] = {"expires": 0.0, "body": None}
+_sessions_lock = asyncio.Lock()
+
+@app.get("/api/sessions")
+async def get_sessions():
+    """Get recent workflow sessions."""
+    try:
+        now = time.monotonic()
+        if _sessions_cache["body"] is not None and now < _sessions_cache["expires"]:
+            return Response(content=_sessions_cache["body"], media_type="application/json")
+
+        # One request rebuilds; concurrent pollers wait and hit the cache
+        async with _sessions_lock:
+            now = time.monotonic()
+            if _sessions_cache["body"] is None or now >= _sessions_cache["expires"]:
+                sessions = workflow_monitor.get_recent_sessions(limit=20)
+                _sessions_cache["body"] = orjson.dumps({
+                    "success": True,
+                    "sessions": [workflow_monitor._session_to_dict(session) for session in sessions]
+                })
+                _sessions_cache["expires"] = now + _SESSIONS_TTL
+        return Response(content=_sessions_cache["body"], media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching sessions: {str(e)}")
 
@@ -186,59 +284,110 @@ async def get_session(session_id: str):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching session: {str(e)}")
 
+# Listing cache for /api/generated-projects, keyed by the directory mtime
+_projects_cache: Dict[str, Any] = {"mtime": None, "payload": None}
+
+@functools.lru_cache(maxsize=512)
+def _file_preview(path: str, mtime_ns: int, size: int) -> str:
+    """Read a short file preview, memoized on (path, mtime, size).
+
+    Only the first KiB is read via pread - the preview is capped at 500
+    characters, so pulling the whole file in was wasted I/O.
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            head = os.pread(fd, 1024, 0)
+        finally:
+            os.close(fd)
+    except OSError:
+        return "Could not read file content"
+
+    content = head.decode('utf-8', errors='replace')
+    if size > len(head) or len(content) > 500:
+        return content[:500] + "..."
+    return content
+
 @app.get("/api/generated-projects")
 async def get_generated_projects():
-    """Get list of generated projects."""
+    """Get list of generated projects (metadata only).
+
+    Previews are served on demand by the per-file endpoint below, so
+    listing a large directory never reads file contents.
+    """
     try:
         project_root = "/app/generated_project"
+        try:
+            root_mtime = os.stat(project_root).st_mtime_ns
+        except FileNotFoundError:
+            return {"success": True, "projects": []}
+
+        # Unchanged directory means the cached payload is still valid
+        if _projects_cache["mtime"] == root_mtime:
+            return _projects_cache["payload"]
+
         projects = []
-        
-        if os.path.exists(project_root):
-            for item in os.listdir(project_root):
-                item_path = os.path.join(project_root, item)
-                if os.path.isfile(item_path):
-                    # Read file content for preview
+        # scandir yields name/type/stat from one pass instead of a
+        # listdir + isfile/getsize/getmtime syscall per entry
+        with os.scandir(project_root) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    projects.append({
+                        "name": entry.name,
+                        "path": entry.path,
+                        "type": "file",
+                        "size": entry.stat().st_size
+                    })
+                elif entry.is_dir():
                     try:
-                        with open(item_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                        projects.append({
-                            "name": item,
-                            "path": item_path,
-                            "type": "file",
-                            "preview": content[:500] + "..." if len(content) > 500 else content
-                        })
+                        files = os.listdir(entry.path)
                     except Exception:
-                        projects.append({
-                            "name": item,
-                            "path": item_path,
-                            "type": "file",
-                            "preview": "Could not read file content"
-                        })
-                elif os.path.isdir(item_path):
-                    # List directory contents
-                    try:
-                        files = os.listdir(item_path)
-                        projects.append({
-                            "name": item,
-                            "path": item_path,
-                            "type": "directory",
-                            "files": files
-                        })
-                    except Exception:
-                        projects.append({
-                            "name": item,
-                            "path": item_path,
-                            "type": "directory",
-                            "files": []
-                        })
-        
-        return {
-            "success": True,
-            "projects": projects
-        }
+                        files = []
+                    projects.append({
+                        "name": entry.name,
+                        "path": entry.path,
+                        "type": "directory",
+                        "files": files
+                    })
+
+        payload = {"success": True, "projects": projects}
+        _projects_cache["mtime"] = root_mtime
+        _projects_cache["payload"] = payload
+        return payload
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching projects: {str(e)}")
 
+@app.get("/api/generated-projects/{name}/preview")
+async def get_project_preview(name: str):
+    """Get the short preview for one generated file, read on demand."""
+    if os.sep in name or name.startswith('.'):
+        raise HTTPException(status_code=404, detail="File not found")
+    path = os.path.join("/app/generated_project", name)
+    try:
+        stat = await asyncio.to_thread(os.stat, path)
+    except OSError:
+        raise HTTPException(status_code=404, detail="File not found")
+    preview = await run_in_threadpool(_file_preview, path, stat.st_mtime_ns, stat.st_size)
+    return {"success": True, "name": name, "preview": preview}
+
+# Template assets live on disk under agent/templates/<type>/
+_TEMPLATES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "agent", "templates")
+_TEMPLATE_FILE_NAMES = {"index.html", "style.css", "script.js"}
+
+@app.get("/api/template/{name}/{file}")
+async def get_template_file(name: str, file: str):
+    """Serve a raw template asset straight from disk.
+
+    FileResponse streams the file via Starlette's sendfile path instead of
+    round-tripping the content through a Python string.
+    """
+    if file not in _TEMPLATE_FILE_NAMES or os.sep in name or name.startswith('.'):
+        raise HTTPException(status_code=404, detail="Template file not found")
+    path = os.path.join(_TEMPLATES_DIR, name, file)
+    if not os.path.isfile(path):
+        raise HTTPException(status_code=404, detail="Template file not found")
+    return FileResponse(path)
+
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket endpoint for real-time updates."""
@@ -246,10 +395,20 @@ async def websocket_endpoint(websocket: WebSocket):
     try:
         while True:
             data = await websocket.receive_text()
-            message_data = json.loads(data)
-            
+
+            # Pings dominate the inbound traffic; the exact-frame compare
+            # answers them without parsing at all
+            if data == '{"type": "ping"}' or data == '{"type":"ping"}':
+                await websocket.send_text('{"type": "pong"}')
+                continue
+
+            try:
+                message_data = orjson.loads(data)
+            except orjson.JSONDecodeError:
+                continue  # Malformed frame; drop it rather than 500 the socket
+
             if message_data.get("type") == "ping":
-                await websocket.send_text(json.dumps({"type": "pong"}))
+                await websocket.send_text('{"type": "pong"}')
             elif message_data.get("type") == "get_status":
                 # Send current workflow status
                 status = {
@@ -257,25 +416,93 @@ async def websocket_endpoint(websocket: WebSocket):
                     "active_session": workflow_monitor.active_session_id,
                     "recent_sessions": len(workflow_monitor.sessions)
                 }
-                await websocket.send_text(json.dumps(status))
+                await websocket.send_text(orjson.dumps(status).decode())
                 
     except WebSocketDisconnect:
         manager.disconnect(websocket)
 
-# Set up workflow monitor callback for real-time updates
+# Set up workflow monitor callback for real-time updates.
+# The monitor fires callbacks synchronously from whatever thread runs the
+# workflow, so events are handed to the loop thread via call_soon_threadsafe
+# and drained by a single broadcaster coroutine instead of spawning a task
+# per event (asyncio.create_task raises off the loop thread).
+_event_loop: Optional[asyncio.AbstractEventLoop] = None
+_event_queue: asyncio.Queue = asyncio.Queue(maxsize=1024)
+
 def workflow_callback(event_type: str, data: Any):
     """Callback for workflow events to send real-time updates."""
+    # Session state changed; the next poll must see it immediately
+    _sessions_cache["expires"] = 0.0
+
+    # Pass the payload through structured; only leaves orjson can't encode
+    # (e.g. dataclass instances) fall back to str, instead of flattening
+    # the whole event into one repr string
     message = {
         "type": "workflow_update",
         "event": event_type,
-        "data": str(data)  # Convert to string for JSON serialization
+        "data": data
     }
-    
-    # Send to all connected WebSocket clients
-    asyncio.create_task(manager.broadcast(json.dumps(message)))
 
-workflow_monitor.subscribe(workflow_callback)
+    if _event_loop is None:
+        return
+    # call_soon_threadsafe only schedules the put; a QueueFull would raise
+    # later inside the loop thread, so the drop has to happen in the
+    # helper that actually performs it
+    _event_loop.call_soon_threadsafe(_enqueue_event, message)
+
+def _enqueue_event(message: Dict[str, Any]):
+    """Put an event on the queue; runs on the event loop thread."""
+    try:
+        _event_queue.put_nowait(message)
+    except asyncio.QueueFull:
+        pass  # Drop rather than back up under a burst
+
+async def _broadcast_worker():
+    """Drain workflow events and fan them out to WebSocket clients.
+
+    Events that arrive in a burst are batched (up to 32) into a single
+    JSON array so a rapid step sequence costs one send per client.
+    """
+    while True:
+        batch = [await _event_queue.get()]
+        while len(batch) < 32:
+            try:
+                batch.append(_event_queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        payload = orjson.dumps(
+            batch[0] if len(batch) == 1 else batch, default=str
+        ).decode()
+        manager.broadcast(payload)
+
+@app.on_event("startup")
+async def _preload_agents():
+    """Pay one-time initialization at startup instead of on first request.
+
+    Builds the lazily-constructed model clients and materializes the
+    default template, so the first user request skips client auth setup
+    and template loading.
+    """
+    ultra_fast_qa_agent.fast_llm
+    ultra_fast_qa_agent.standard_llm
+    await run_in_threadpool(instant_generator._get_template, 'todo_app')
+
+@app.on_event("startup")
+async def _start_broadcast_worker():
+    # Subscribe only once the loop exists so the callback never fires
+    # before call_soon_threadsafe has a live target
+    global _event_loop
+    _event_loop = asyncio.get_running_loop()
+    asyncio.create_task(_broadcast_worker())
+    workflow_monitor.subscribe(workflow_callback)
 
 if __name__ == "__main__":
+    import sys
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+    # uvloop/httptools swap the event loop and HTTP parser for their C
+    # implementations (Unix only). reload is off so workers>1 is usable.
+    extra = {"loop": "uvloop", "http": "httptools"} if sys.platform != "win32" else {}
+    uvicorn.run(
+        "web_server:app", host="0.0.0.0", port=8000,
+        workers=int(os.environ.get("WEB_WORKERS", "1")), **extra
+    )
\ No newline at end of file
@@ -2,23 +2,38 @@
 Optimized FastAPI web server with ultra-fast responses and streaming.
 """
 
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, HTTPException, Response, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
 import asyncio
-import json
+import logging
+import orjson
 import uuid
 import os
 import time
 
+logger = logging.getLogger(__name__)
+
 # Import optimized agents
 from agent.fast_qa_agent import ultra_fast_qa_agent
 from agent.fast_project_generator import fast_project_generator
 from agent.monitoring import workflow_monitor
 
-app = FastAPI(title="Coder Buddy Dashboard - Optimized", version="2.0.0")
+class FastResponse(Response):
+    """orjson response that also accepts non-string dict keys.
+
+    orjson handles nested dicts, dataclasses, datetimes and UUIDs in C,
+    so handler return values skip the pure-Python encoder walk.
+    """
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+app = FastAPI(title="Coder Buddy Dashboard - Optimized", version="2.0.0",
+              default_response_class=FastResponse)
 
 # CORS middleware
 app.add_middleware(
@@ -43,53 +58,110 @@ class StreamingQARequest(BaseModel):
     question: str
     context: Optional[str] = ""
 
+# Constant SSE control frames, encoded once at import
+_SSE_START = b"data: " + orjson.dumps({"type": "start", "message": "Processing your question..."}) + b"\n\n"
+_SSE_THINKING = b"data: " + orjson.dumps({"type": "thinking", "message": "Generating response..."}) + b"\n\n"
+
 # WebSocket connection manager with optimizations
 class OptimizedConnectionManager:
+    # Refuse connections beyond this; the server stays responsive for
+    # existing clients instead of degrading for everyone
+    MAX_CONNECTIONS = 500
+    # Per-client outbox bound: a stalled client drops its own oldest
+    # frames instead of stalling the fan-out
+    CLIENT_QUEUE_SIZE = 64
+    # Messages coalesced into one frame per drain tick
+    MAX_BATCH = 16
+
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
-        self.connection_pool = asyncio.Queue(maxsize=100)
+        # Each connection gets its own bounded outbox drained by its own
+        # writer task, so the slowest consumer cannot block the rest
+        self.active_connections: Dict[WebSocket, asyncio.Queue] = {}
+        self.outbox: asyncio.Queue = asyncio.Queue()
 
-    async def connect(self, websocket: WebSocket):
+    async def connect(self, websocket: WebSocket) -> bool:
+        if len(self.active_connections) >= self.MAX_CONNECTIONS:
+            # 1013: try again later
+            await websocket.close(code=1013)
+            return False
         await websocket.accept()
-        self.active_connections.append(websocket)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.CLIENT_QUEUE_SIZE)
+        self.active_connections[websocket] = queue
+        asyncio.create_task(self._writer(websocket, queue))
+        return True
 
     def disconnect(self, websocket: WebSocket):
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        queue = self.active_connections.pop(websocket, None)
+        if queue is not None:
+            # Wake the writer with a shutdown sentinel so it exits instead
+            # of blocking on an empty queue forever; the client is gone, so
+            # dropping one backlogged frame to make room is fine
+            try:
+                queue.put_nowait(None)
+            except asyncio.QueueFull:
+                queue.get_nowait()
+                queue.put_nowait(None)
 
-    async def broadcast_fast(self, message: dict):
-        """Optimized broadcast with error handling."""
-        if not self.active_connections:
-            return
-        
-        message_str = json.dumps(message)
-        disconnected = []
-        
-        # Send to all connections concurrently
-        tasks = []
-        for connection in self.active_connections:
-            tasks.append(self._send_safe(connection, message_str))
-        
-        # Wait for all sends to complete
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Remove disconnected clients
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                disconnected.append(self.active_connections[i])
-        
-        for conn in disconnected:
-            self.disconnect(conn)
-
-    async def _send_safe(self, websocket: WebSocket, message: str):
-        """Send message safely with error handling."""
+    async def _writer(self, websocket: WebSocket, queue: asyncio.Queue):
+        """Drain one client's outbox for as long as it stays connected."""
         try:
-            await websocket.send_text(message)
+            while True:
+                blob = await queue.get()
+                if blob is None:  # disconnect sentinel
+                    break
+                await websocket.send_bytes(blob)
         except Exception:
-            raise  # Will be caught by gather
+            self.disconnect(websocket)
+
+    async def broadcast_fast(self, message: dict):
+        """Queue a message for the coalescing drain loop."""
+        self.outbox.put_nowait(message)
+
+    async def _drain_loop(self):
+        """Coalesce queued messages and fan each batch out once per client.
+
+        A burst of events costs one serialization and one put per client
+        per tick instead of one send per message; writer tasks do the
+        actual socket I/O at each client's own pace.
+        """
+        while True:
+            items = [await self.outbox.get()]
+            while len(items) < self.MAX_BATCH:
+                try:
+                    items.append(self.outbox.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            if not self.active_connections:
+                continue
+
+            if len(items) == 1:
+                blob = orjson.dumps(items[0])
+            else:
+                blob = orjson.dumps({"type": "batch", "items": items})
+
+            for queue in list(self.active_connections.values()):
+                try:
+                    queue.put_nowait(blob)
+                except asyncio.QueueFull:
+                    # Drop the oldest frame to make room for the newest
+                    try:
+                        queue.get_nowait()
+                        queue.put_nowait(blob)
+                    except (asyncio.QueueEmpty, asyncio.QueueFull):
+                        pass
 
 manager = OptimizedConnectionManager()
 
+@app.on_event("startup")
+async def _enable_eager_tasks():
+    # Coroutines that can complete without suspending (sends into a
+    # non-full write buffer) finish synchronously instead of paying a
+    # scheduler round-trip each. Added in Python 3.12.
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+    asyncio.create_task(manager._drain_loop())
+
 # Optimized API Routes
 
 @app.get("/")
@@ -100,122 +172,148 @@ async def root():
         "optimizations": ["Fast Models", "Caching", "Parallel Processing", "Templates"]
     }
 
+# Both polled endpoints below return near-constant payloads; the
+# serialized bytes are reused within a 1s TTL window
+_health_cache: Dict[str, Any] = {"blob": None, "ts": 0.0}
+_stats_cache: Dict[str, Any] = {"blob": None, "ts": 0.0}
+
 @app.get("/api/health")
 async def health_check():
     """Optimized health check with performance metrics."""
-    start_time = time.time()
-    
+    now = time.monotonic()
+    if _health_cache["blob"] is not None and now - _health_cache["ts"] < 1.0:
+        return Response(_health_cache["blob"], media_type="application/json")
+
+    t0 = time.perf_counter_ns()
+
     # Quick system check
-    response_time = (time.time() - start_time) * 1000
-    
-    return {
+    response_time_ms = (time.perf_counter_ns() - t0) // 1_000_000
+
+    blob = orjson.dumps({
         "status": "healthy",
         "service": "Coder Buddy Dashboard - Optimized",
-        "response_time_ms": round(response_time, 2),
+        "response_time_ms": response_time_ms,
         "optimizations_active": True,
         "cache_status": "active",
         "fast_models": "enabled"
-    }
+    })
+    _health_cache["blob"] = blob
+    _health_cache["ts"] = now
+    return Response(blob, media_type="application/json")
 
 @app.post("/api/generate-project-fast")
 async def generate_project_fast(request: ProjectRequest):
     """Ultra-fast project generation endpoint."""
-    start_time = time.time()
-    
+    t0 = time.perf_counter_ns()
+
     try:
-        print(f"🚀 Fast project generation request: {request.prompt}")
-        
+        logger.debug("Fast project generation request: %s", request.prompt)
+
         # Use optimized generator
         result = await fast_project_generator.generate_project_fast(request.prompt)
-        
-        total_time = (time.time() - start_time) * 1000
-        
+
+        total_ms = (time.perf_counter_ns() - t0) // 1_000_000
+
         # Broadcast to WebSocket clients
         await manager.broadcast_fast({
             "type": "project_completed",
             "data": {
                 "session_id": result.get("session_id"),
-                "generation_time": total_time,
+                "generation_time": total_ms,
                 "success": result.get("success", False)
             }
         })
-        
+
         return {
             **result,
-            "api_response_time": round(total_time, 2),
-            "message": f"Project generated in {total_time:.0f}ms! ⚡"
+            "api_response_time": total_ms,
+            "message": f"Project generated in {total_ms}ms! ⚡"
         }
-        
+
     except Exception as e:
-        error_time = (time.time() - start_time) * 1000
-        print(f"❌ Fast generation error after {error_time:.1f}ms: {str(e)}")
+        error_ms = (time.perf_counter_ns() - t0) // 1_000_000
+        logger.error("Fast generation error after %dms: %s", error_ms, e)
         raise HTTPException(status_code=500, detail=f"Error generating project: {str(e)}")
 
 @app.post("/api/ask-question-fast")
 async def ask_question_fast(request: QARequest):
     """Ultra-fast Q&A endpoint with caching."""
-    start_time = time.time()
-    
+    t0 = time.perf_counter_ns()
+
     try:
-        print(f"🔥 Fast Q&A request: {request.question[:50]}...")
-        
+        logger.debug("Fast Q&A request: %.50s...", request.question)
+
         # Use ultra-fast agent
         if request.fast_mode:
             answer = await ultra_fast_qa_agent.answer_question_async(request.question, request.context)
         else:
             answer = ultra_fast_qa_agent.answer_question(request.question, request.context)
-        
-        response_time = (time.time() - start_time) * 1000
-        
+
+        response_ms = (time.perf_counter_ns() - t0) // 1_000_000
+
         return {
             "success": True,
             "answer": answer,
             "question": request.question,
             "is_technical": ultra_fast_qa_agent.is_technical_question(request.question),
-            "response_time_ms": round(response_time, 2),
-            "cached": response_time < 100,  # Likely cached if < 100ms
+            "response_time_ms": response_ms,
+            "cached": response_ms < 100,  # Likely cached if < 100ms
             "fast_mode": request.fast_mode
         }
-        
+
     except Exception as e:
-        error_time = (time.time() - start_time) * 1000
-        print(f"❌ Fast Q&A error after {error_time:.1f}ms: {str(e)}")
+        error_ms = (time.perf_counter_ns() - t0) // 1_000_000
+        logger.error("Fast Q&A error after %dms: %s", error_ms, e)
         raise HTTPException(status_code=500, detail=f"Error processing question: {str(e)}")
 
+def _try_instant(question: str, context: str):
+    """Synchronous quick-response + cache probe; returns the answer or None."""
+    normalized_question = ultra_fast_qa_agent._normalize_question(question)
+    answer = ultra_fast_qa_agent.quick_responses.get(normalized_question)
+    if answer is not None:
+        return answer
+    cache = ultra_fast_qa_agent.cache
+    return cache.get_resolved(cache.resolve_pair(question, context or ""))
+
 @app.post("/api/ask-question-streaming")
 async def ask_question_streaming(request: StreamingQARequest):
     """Streaming Q&A endpoint for real-time responses."""
-    
+
+    # Instant hits skip the streaming machinery entirely: no generator,
+    # no chunked transfer, just one pre-serialized JSON body
+    hit = _try_instant(request.question, request.context)
+    if hit is not None:
+        return Response(
+            orjson.dumps({"answer": hit, "cached": True}),
+            media_type="application/json"
+        )
+
     async def generate_response():
         try:
             # Start with immediate acknowledgment
-            yield f"data: {json.dumps({'type': 'start', 'message': 'Processing your question...'})}\n\n"
-            
-            # Check for instant responses first
-            normalized_question = ultra_fast_qa_agent._normalize_question(request.question)
-            if normalized_question in ultra_fast_qa_agent.quick_responses:
-                answer = ultra_fast_qa_agent.quick_responses[normalized_question]
-                yield f"data: {json.dumps({'type': 'complete', 'answer': answer, 'response_time': '< 1ms'})}\n\n"
-                return
-            
-            # Check cache
-            cache_key = f"{request.question}|{request.context}"
-            cached_answer = ultra_fast_qa_agent.cache.get(cache_key)
-            if cached_answer:
-                yield f"data: {json.dumps({'type': 'complete', 'answer': cached_answer, 'response_time': '< 10ms (cached)'})}\n\n"
-                return
-            
+            yield _SSE_START
+
             # Generate new response
-            yield f"data: {json.dumps({'type': 'thinking', 'message': 'Generating response...'})}\n\n"
-            
+            yield _SSE_THINKING
+
             answer = await ultra_fast_qa_agent.answer_question_async(request.question, request.context)
-            
-            yield f"data: {json.dumps({'type': 'complete', 'answer': answer, 'response_time': 'Generated fresh'})}\n\n"
-            
+
+            yield b"data: " + orjson.dumps({'type': 'complete', 'answer': answer, 'response_time': 'Generated fresh'}) + b"\n\n"
+
         except Exception as e:
-            yield f"data: {json.dumps({'type': 'error', 'error': str(e)})}\n\n"
+            yield b"data: " + orjson.dumps({'type': 'error', 'error': str(e)}) + b"\n\n"
     
-    return StreamingResponse(generate_response(), media_type="text/plain")
+    # text/event-stream lets EventSource clients consume the frames and
+    # the headers stop proxies from buffering away the streaming win
+    return StreamingResponse(
+        generate_response(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+            "Connection": "keep-alive"
+        }
+    )
 
 # Legacy endpoints for backward compatibility
 @app.post("/api/generate-project")
@@ -241,93 +339,115 @@ async def get_sessions():
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching sessions: {str(e)}")
 
+def _read_preview(path: str) -> str:
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read(200)  # Read only first 200 chars
+    return content + "..." if len(content) == 200 else content
+
+_PROJECTS_ROOT = "/app/generated_project"
+# Serialized project list keyed by directory mtime: while nothing is
+# added or removed, polling costs one stat and a memcpy
+_projects_cache: Dict[str, Any] = {"mtime": None, "blob": None}
+_EMPTY_PROJECTS = b'{"success": true, "projects": []}'
+
+def _build_projects_blob() -> bytes:
+    """Scan the project directory and serialize the full response body."""
+    try:
+        with os.scandir(_PROJECTS_ROOT) as entries:
+            files = [(e.name, e.path) for e in entries if e.is_file()]
+    except FileNotFoundError:
+        return _EMPTY_PROJECTS
+
+    projects = []
+    for name, path in files[:20]:  # Limit for performance
+        try:
+            preview = _read_preview(path)
+        except Exception:
+            preview = "Preview not available"
+        projects.append({
+            "name": name,
+            "path": path,
+            "type": "file",
+            "preview": preview
+        })
+    return orjson.dumps({"success": True, "projects": projects})
+
 @app.get("/api/generated-projects")
 async def get_generated_projects():
-    """Get list of generated projects - optimized."""
+    """Get list of generated projects - served from an mtime-keyed cache."""
     try:
-        project_root = "/app/generated_project"
-        projects = []
-        
-        if os.path.exists(project_root):
-            # Use async file operations for better performance
-            items = os.listdir(project_root)
-            
-            for item in items[:20]:  # Limit for performance
-                item_path = os.path.join(project_root, item)
-                if os.path.isfile(item_path):
-                    try:
-                        # Quick preview only
-                        with open(item_path, 'r', encoding='utf-8') as f:
-                            content = f.read(200)  # Read only first 200 chars
-                        projects.append({
-                            "name": item,
-                            "path": item_path,
-                            "type": "file",
-                            "preview": content + "..." if len(content) == 200 else content
-                        })
-                    except Exception:
-                        projects.append({
-                            "name": item,
-                            "path": item_path,
-                            "type": "file",
-                            "preview": "Preview not available"
-                        })
-        
-        return {
-            "success": True,
-            "projects": projects,
-            "count": len(projects)
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error fetching projects: {str(e)}")
+        mtime = (await asyncio.to_thread(os.stat, _PROJECTS_ROOT)).st_mtime_ns
+    except FileNotFoundError:
+        return Response(_EMPTY_PROJECTS, media_type="application/json")
+
+    if _projects_cache["mtime"] != mtime:
+        _projects_cache["blob"] = await asyncio.to_thread(_build_projects_blob)
+        _projects_cache["mtime"] = mtime
+
+    return Response(_projects_cache["blob"], media_type="application/json")
+
+def _performance_stats_blob() -> bytes:
+    """Serialized performance stats, memoized for one second."""
+    now = time.monotonic()
+    if _stats_cache["blob"] is None or now - _stats_cache["ts"] >= 1.0:
+        cache = ultra_fast_qa_agent.cache
+        lookups = cache.hits + cache.misses
+        _stats_cache["blob"] = orjson.dumps({
+            "cache_size": len(cache.memory_cache),
+            "cache_hits": cache.hits,
+            "cache_misses": cache.misses,
+            "cache_hit_rate": round(cache.hits / lookups, 3) if lookups else None,
+            "active_connections": len(manager.active_connections),
+            "optimizations": {
+                "fast_models": "gemini-1.5-flash-8b",
+                "caching": "active",
+                "parallel_processing": "enabled",
+                "templates": "loaded"
+            },
+            "response_times": {
+                "cached_qa": "< 10ms",
+                "quick_responses": "< 1ms",
+                "template_projects": "< 100ms",
+                "custom_projects": "< 3000ms"
+            }
+        })
+        _stats_cache["ts"] = now
+    return _stats_cache["blob"]
 
 @app.get("/api/performance-stats")
 async def get_performance_stats():
     """Get performance statistics."""
-    return {
-        "cache_size": len(ultra_fast_qa_agent.cache.memory_cache),
-        "active_connections": len(manager.active_connections),
-        "optimizations": {
-            "fast_models": "gemini-1.5-flash-8b",
-            "caching": "active",
-            "parallel_processing": "enabled",
-            "templates": "loaded"
-        },
-        "response_times": {
-            "cached_qa": "< 10ms",
-            "quick_responses": "< 1ms",
-            "template_projects": "< 100ms",
-            "custom_projects": "< 3000ms"
-        }
-    }
+    return Response(_performance_stats_blob(), media_type="application/json")
+
+# Pong frames differ only in the timestamp, so everything else is
+# encoded once at import
+_PONG_PREFIX = b'{"type": "pong", "timestamp": '
 
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     """Optimized WebSocket endpoint."""
-    await manager.connect(websocket)
+    if not await manager.connect(websocket):
+        return
     try:
         while True:
             data = await websocket.receive_text()
-            message_data = json.loads(data)
-            
+            message_data = orjson.loads(data)
+
             if message_data.get("type") == "ping":
-                await websocket.send_text(json.dumps({
-                    "type": "pong",
-                    "timestamp": time.time()
-                }))
+                await websocket.send_bytes(
+                    _PONG_PREFIX + str(time.time()).encode() + b"}"
+                )
             elif message_data.get("type") == "get_performance":
-                stats = {
-                    "type": "performance_update",
-                    "cache_size": len(ultra_fast_qa_agent.cache.memory_cache),
-                    "active_connections": len(manager.active_connections),
-                    "fast_mode": True
-                }
-                await websocket.send_text(json.dumps(stats))
-                
+                await websocket.send_bytes(_performance_stats_blob())
+
     except WebSocketDisconnect:
         manager.disconnect(websocket)
 
 if __name__ == "__main__":
+    import sys
     import uvicorn
     print("🚀 Starting Coder Buddy - Ultra Fast Mode!")
-    uvicorn.run(app, host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+    # uvloop/httptools swap the pure-Python event loop and HTTP parser
+    # for C implementations; neither is available on Windows
+    extra = {"loop": "uvloop", "http": "httptools"} if sys.platform != "win32" else {}
+    uvicorn.run(app, host="0.0.0.0", port=8000, **extra)
\ No newline at end of file